@@ -4,7 +4,7 @@ Decision audit logging using Redis Streams.
 
 import json
 from datetime import datetime, timezone
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,6 +37,23 @@ class AuditLog:
         self.redis.xadd(self.stream_key, entry)
         logger.info(f"Logged decision: {decision_type} by {agent_id}")
 
+    def log_decisions(self, decisions: List[Tuple[str, str, str, str, str]]):
+        """Log (agent_id, decision_type, context, reason, timestamp) entries in one round-trip."""
+        if not decisions:
+            return
+
+        pipe = self.redis.pipeline(transaction=False)
+        for agent_id, decision_type, context, reason, timestamp in decisions:
+            pipe.xadd(self.stream_key, {
+                "agent_id": agent_id,
+                "decision_type": decision_type,
+                "context": context,
+                "reason": reason,
+                "timestamp": timestamp
+            })
+        pipe.execute()
+        logger.info(f"Logged {len(decisions)} decisions")
+
     def get_recent_decisions(self, count: int = 100) -> List[Dict]:
         """Retrieve recent decisions from the log."""
         entries = self.redis.xrevrange(self.stream_key, count=count)
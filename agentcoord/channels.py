@@ -9,15 +9,18 @@ through a unified interface.
 import sys
 import json
 import uuid
+import queue
+import atexit
 import logging
+import weakref
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from collections import deque
-from threading import Lock
+from threading import Event, Lock, Thread, Timer, current_thread
 
 try:
     from rich.console import Console
@@ -28,6 +31,12 @@ try:
 except ImportError:
     RICH_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -48,6 +57,32 @@ class MessageType(str, Enum):
     ANNOUNCEMENT = "announcement"  # Broadcast announcement
 
 
+def _json_default(obj: Any) -> Any:
+    """Encode the datetimes and enums that orjson handles natively."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+# Built once; json.dumps(default=...) would construct a new encoder per call
+_JSON_ENCODER = json.JSONEncoder(default=_json_default)
+
+# Userspace buffer for the FileChannel log handle; batches are flushed as they are written
+LOG_BUFFER_SIZE = 1 << 20
+
+# Buffered FileChannels still open; held weakly so a dropped channel can be collected
+_buffered_file_channels: "weakref.WeakSet[FileChannel]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_buffered_file_channels():
+    """Write out batches left in buffered FileChannels when the process exits."""
+    for channel in list(_buffered_file_channels):
+        channel.close()
+
+
 @dataclass
 class Message:
     """Structured message for channel delivery."""
@@ -146,6 +181,14 @@ class CommunicationChannel(ABC):
         """
         pass
 
+    def flush(self):
+        """Deliver any buffered messages. Unbuffered channels have nothing to do."""
+        pass
+
+    def close(self):
+        """Flush and release any resources held by the channel."""
+        self.flush()
+
     def enable(self):
         """Enable this channel."""
         self.enabled = True
@@ -248,10 +291,36 @@ class TerminalChannel(CommunicationChannel):
 class FileChannel(CommunicationChannel):
     """File-based channel for persistent logging."""
 
-    def __init__(self, name: str = "file", log_path: Optional[Path] = None):
+    def __init__(
+        self,
+        name: str = "file",
+        log_path: Optional[Path] = None,
+        max_buffered: int = 1,
+        flush_interval: float = 1.0
+    ):
+        """
+        Initialize file channel.
+
+        Args:
+            name: Unique identifier for this channel instance
+            log_path: JSONL file to append to
+            max_buffered: Entries to hold before writing them in one batch;
+                1 writes every entry before post() returns
+            flush_interval: Seconds after which a partial batch is written
+                by a background timer, even if nothing else is posted
+        """
         super().__init__(name)
         self.log_path = log_path or Path("agentcoord_messages.jsonl")
         self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_buffered = max_buffered
+        self.flush_interval = flush_interval
+        self._buffer: List[bytes] = []
+        self._flush_timer: Optional[Timer] = None
+        self._lock = Lock()
+        # Opened on first write so a channel that never writes never creates the file
+        self._fh = None
+        if max_buffered > 1:
+            _buffered_file_channels.add(self)
 
     def _write_message(self, message: Message, event_type: str) -> bool:
         """Write message to log file."""
@@ -259,26 +328,98 @@ class FileChannel(CommunicationChannel):
             return False
 
         log_entry = {
-            "timestamp": message.timestamp.isoformat(),
+            "timestamp": message.timestamp,
             "event_type": event_type,
             "from_agent": message.from_agent,
             "to_agent": message.to_agent,
             "channel": message.channel,
-            "priority": message.priority.value,
-            "message_type": message.message_type.value,
+            "priority": message.priority,
+            "message_type": message.message_type,
             "content": message.content,
             "thread_id": message.thread_id,
             "metadata": message.metadata
         }
 
         try:
-            with open(self.log_path, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            line = self._encode_entry(log_entry)
+            with self._lock:
+                self._buffer.append(line)
+                if len(self._buffer) >= self.max_buffered:
+                    self._write_buffer()
+                elif self._flush_timer is None:
+                    # First entry of a partial batch; write it out by flush_interval
+                    self._flush_timer = Timer(self.flush_interval, self.flush)
+                    self._flush_timer.daemon = True
+                    self._flush_timer.start()
             return True
         except Exception as e:
             print(f"FileChannel error: {e}", file=sys.stderr)
             return False
 
+    def _write_buffer(self):
+        """Append buffered lines in one write. Caller holds self._lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        batch, self._buffer = self._buffer, []
+        if self._fh is None:
+            self._fh = open(self.log_path, "ab", buffering=LOG_BUFFER_SIZE)
+        self._fh.write(b"".join(batch))
+        # Flush at the batch boundary, so readers see every batch once it is written
+        self._fh.flush()
+
+    def flush(self):
+        """Write any buffered entries to the log file."""
+        with self._lock:
+            if self._buffer:
+                self._write_buffer()
+
+    def close(self):
+        """Write buffered entries and close the log file."""
+        with self._lock:
+            if self._buffer:
+                self._write_buffer()
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+        _buffered_file_channels.discard(self)
+
+    def __del__(self):
+        # A pending flush timer keeps the channel alive, so anything left
+        # here was buffered after the last flush; write it before closing
+        if getattr(self, "_fh", None) is not None or getattr(self, "_buffer", None):
+            try:
+                self.close()
+            except Exception as e:
+                print(f"FileChannel error: {e}", file=sys.stderr)
+
+    @staticmethod
+    def _encode_entry(log_entry: Dict[str, Any]) -> bytes:
+        """Serialize a log entry as one newline-terminated JSONL line."""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(
+                log_entry, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS
+            )
+        return (_JSON_ENCODER.encode(log_entry) + "\n").encode()
+
+    def iter_entries(self) -> Iterator[Dict[str, Any]]:
+        """
+        Stream logged entries, oldest first, one line at a time.
+
+        Buffered entries are flushed first so they are included.
+        Yields nothing if the log has not been written yet.
+        """
+        self.flush()
+        loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+        try:
+            f = open(self.log_path, "rb")
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if line.strip():
+                    yield loads(line)
+
     def post(self, message: Message) -> bool:
         """Log channel post."""
         return self._write_message(message, "post")
@@ -395,12 +536,65 @@ class DashboardChannel(CommunicationChannel):
         return feature in ["threads", "formatting", "realtime"]
 
 
+def _send_to(channels: List[CommunicationChannel], method: str, message: Message) -> Dict[str, Any]:
+    """Call method with message on every enabled channel."""
+    results = {}
+    for ch in channels:
+        if ch.enabled:
+            results[ch.name] = getattr(ch, method)(message)
+    return results
+
+
+def _run_delivery_worker(work_queue: queue.Queue, channels: List[CommunicationChannel]):
+    """Deliver queued messages in order until the None sentinel arrives.
+
+    Takes the manager's queue and channel list rather than the manager, so a
+    running worker does not keep an unreferenced ChannelManager alive.
+    """
+    while True:
+        item = work_queue.get()
+        if item is None:
+            return
+        if isinstance(item, Event):
+            item.set()
+            continue
+        method, message = item
+        try:
+            _send_to(channels, method, message)
+        except Exception as e:
+            logger.error(f"Async {method} failed: {e}")
+
+
+def _stop_delivery_worker(work_queue: queue.Queue, worker: Thread):
+    """Let the worker finish what is queued, then wait for it to exit."""
+    work_queue.put(None)
+    if worker is not current_thread():
+        worker.join()
+
+
 class ChannelManager:
     """Manages multiple communication channels and broadcasts."""
 
-    def __init__(self):
+    def __init__(self, async_mode: bool = False):
+        """
+        Initialize channel manager.
+
+        Args:
+            async_mode: Queue posts, DMs, replies and broadcasts for a
+                background thread to deliver, so callers do not wait on
+                channel I/O. Those calls then return an empty dict.
+                After close(), they are delivered inline again.
+        """
         self.channels: List[CommunicationChannel] = []
         self._channel_map = {}  # name -> channel
+        self.async_mode = async_mode
+        # (method, message), an Event the worker sets on reaching it, or None to stop
+        self._queue = queue.Queue()
+        self._worker: Optional[Thread] = None
+        # Stops the worker on close(), garbage collection or interpreter exit
+        self._worker_finalizer: Optional[weakref.finalize] = None
+        self._worker_lock = Lock()  # guards _worker, _closed and enqueueing
+        self._closed = False
 
     def add_channel(self, channel: CommunicationChannel):
         """
@@ -449,7 +643,8 @@ class ChannelManager:
             metadata: Additional metadata
 
         Returns:
-            Dict mapping channel name to success status
+            Dict mapping channel name to success status (empty in async mode,
+            where delivery happens later on the worker thread)
         """
         message = Message(
             content=content,
@@ -460,12 +655,7 @@ class ChannelManager:
             metadata=metadata
         )
 
-        results = {}
-        for ch in self.channels:
-            if ch.enabled:
-                results[ch.name] = ch.post(message)
-
-        return results
+        return self._deliver("post", message)
 
     def dm(
         self,
@@ -486,7 +676,8 @@ class ChannelManager:
             metadata: Additional metadata
 
         Returns:
-            Dict mapping channel name to success status
+            Dict mapping channel name to success status (empty in async mode,
+            where delivery happens later on the worker thread)
         """
         message = Message(
             content=content,
@@ -496,12 +687,7 @@ class ChannelManager:
             metadata=metadata
         )
 
-        results = {}
-        for ch in self.channels:
-            if ch.enabled:
-                results[ch.name] = ch.dm(message)
-
-        return results
+        return self._deliver("dm", message)
 
     def create_thread(
         self,
@@ -531,12 +717,10 @@ class ChannelManager:
             priority=priority
         )
 
-        results = {}
-        for ch in self.channels:
-            if ch.enabled:
-                results[ch.name] = ch.create_thread(message)
-
-        return results
+        # Callers need the thread IDs, so this is always delivered inline,
+        # after anything already queued
+        self._drain()
+        return self._send("create_thread", message)
 
     def reply_to_thread(
         self,
@@ -555,7 +739,8 @@ class ChannelManager:
             from_agent: Agent replying
 
         Returns:
-            Dict mapping channel name to success status
+            Dict mapping channel name to success status (empty in async mode,
+            where delivery happens later on the worker thread)
         """
         message = Message(
             content=content,
@@ -564,12 +749,7 @@ class ChannelManager:
             thread_id=thread_id
         )
 
-        results = {}
-        for ch in self.channels:
-            if ch.enabled:
-                results[ch.name] = ch.reply_to_thread(message)
-
-        return results
+        return self._deliver("reply_to_thread", message)
 
     def broadcast(
         self,
@@ -588,7 +768,8 @@ class ChannelManager:
             message_type: Message type
 
         Returns:
-            Dict mapping channel name to success status
+            Dict mapping channel name to success status (empty in async mode,
+            where delivery happens later on the worker thread)
         """
         message = Message(
             content=content,
@@ -597,12 +778,62 @@ class ChannelManager:
             message_type=message_type
         )
 
-        results = {}
-        for ch in self.channels:
-            if ch.enabled:
-                results[ch.name] = ch.post(message)
+        return self._deliver("post", message)
+
+    def _send(self, method: str, message: Message) -> Dict[str, Any]:
+        """Call method with message on every enabled channel."""
+        return _send_to(self.channels, method, message)
+
+    def _deliver(self, method: str, message: Message) -> Dict[str, Any]:
+        """Send now, or queue for the worker thread in async mode."""
+        if self.async_mode:
+            # Enqueue under the lock so close() cannot put its sentinel
+            # between the worker check and the put
+            with self._worker_lock:
+                if not self._closed:
+                    self._start_worker()
+                    self._queue.put((method, message))
+                    return {}
+        return self._send(method, message)
+
+    def _start_worker(self):
+        """Start the delivery thread on first use. Caller holds self._worker_lock."""
+        if self._worker is None:
+            self._worker = Thread(
+                target=_run_delivery_worker, args=(self._queue, self.channels),
+                name="channel-manager", daemon=True
+            )
+            self._worker.start()
+            self._worker_finalizer = weakref.finalize(
+                self, _stop_delivery_worker, self._queue, self._worker
+            )
 
-        return results
+    def _drain(self):
+        """Wait until the worker has delivered everything queued before this call."""
+        marker = Event()
+        with self._worker_lock:
+            if self._worker is None:
+                return
+            self._queue.put(marker)
+        marker.wait()
+
+    def flush(self):
+        """Deliver queued messages, then flush buffered messages on every channel."""
+        self._drain()
+        for channel in self.channels:
+            channel.flush()
+
+    def close(self):
+        """Deliver queued messages, stop the worker and close every channel."""
+        with self._worker_lock:
+            # Nothing is queued once _closed is set, so the sentinel lands last
+            self._closed = True
+            self._worker = None
+            finalizer, self._worker_finalizer = self._worker_finalizer, None
+        if finalizer is not None:
+            finalizer()
+        for channel in self.channels:
+            channel.close()
 
     def enable_channels(self, names: List[str]):
         """Enable specific channels."""
@@ -1,14 +1,137 @@
 """CoordinationClient - Main interface for agentcoord framework."""
 
 import redis
-from typing import Optional
+import socket
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
+from urllib.parse import urlparse
 
 from .tasks import TaskQueue
 from .board import Board
 from .agent import AgentRegistry
 from .audit import AuditLog
 
+# Seconds to wait for the reachability probe's TCP connect
+PROBE_TIMEOUT = 0.5
+# Seconds a probe result is remembered before probing the address again
+PROBE_CACHE_TTL = 5.0
+
+# (host, port) or unix socket path -> (reachable, time.monotonic() until which that holds)
+_probe_results: Dict[Union[Tuple[str, int], str], Tuple[bool, float]] = {}
+
+
+def _redis_reachable(address: Union[Tuple[str, int], str]) -> bool:
+    """Check that a (host, port) or unix socket path accepts connections, caching the result.
+
+    redis-py retries a refused connection with backoff before ping() gives up,
+    which takes seconds; a plain connect fails immediately. A cached success
+    skips the probe, so clients of a healthy Redis only pay redis-py's connect.
+    """
+    now = time.monotonic()
+    cached = _probe_results.get(address)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    try:
+        if isinstance(address, str):
+            if not hasattr(socket, "AF_UNIX"):
+                raise OSError("unix sockets are not supported on this platform")
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+                sock.settimeout(PROBE_TIMEOUT)
+                sock.connect(address)
+        else:
+            socket.create_connection(address, timeout=PROBE_TIMEOUT).close()
+    except OSError:
+        _probe_results[address] = (False, now + PROBE_CACHE_TTL)
+        return False
+    _probe_results[address] = (True, now + PROBE_CACHE_TTL)
+    return True
+
+
+class Transport(ABC):
+    """How a CoordinationClient reaches Redis: a cheap probe, then a connect."""
+
+    @abstractmethod
+    def probe(self) -> bool:
+        """Return whether Redis looks reachable, without a full redis-py connect."""
+
+    @abstractmethod
+    def connect(self) -> redis.Redis:
+        """Return a Redis client; only called after probe() succeeds."""
+
+    def mark_unreachable(self):
+        """Record that Redis failed after a successful probe."""
+
+
+class TCPTransport(Transport):
+    """Redis over TCP at host:port."""
+
+    def __init__(self, host: str = "localhost", port: int = 6379):
+        self.host = host
+        self.port = port
+
+    def probe(self) -> bool:
+        return _redis_reachable((self.host, self.port))
+
+    def connect(self) -> redis.Redis:
+        return redis.Redis(host=self.host, port=self.port, decode_responses=True)
+
+    def mark_unreachable(self):
+        _probe_results[(self.host, self.port)] = (False, time.monotonic() + PROBE_CACHE_TTL)
+
+
+class UnixSocketTransport(Transport):
+    """Redis over a local unix domain socket, skipping the TCP stack."""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def probe(self) -> bool:
+        return _redis_reachable(self.path)
+
+    def connect(self) -> redis.Redis:
+        return redis.Redis(unix_socket_path=self.path, decode_responses=True)
+
+    def mark_unreachable(self):
+        _probe_results[self.path] = (False, time.monotonic() + PROBE_CACHE_TTL)
+
+
+class InMemoryTransport(Transport):
+    """Transport that opens no sockets, for tests.
+
+    Probes as reachable or not as configured, and connects to the given
+    client (for example a fakeredis instance).
+    """
+
+    def __init__(self, reachable: bool = False, client: Optional[redis.Redis] = None):
+        self.reachable = reachable
+        self.client = client
+
+    def probe(self) -> bool:
+        return self.reachable
+
+    def connect(self) -> redis.Redis:
+        if self.client is None:
+            raise redis.ConnectionError("InMemoryTransport has no client")
+        return self.client
+
+    def mark_unreachable(self):
+        self.reachable = False
+
+
+def transport_for_url(redis_url: str) -> Transport:
+    """Pick the transport for a redis://host:port or unix:///path URL."""
+    if redis_url.startswith("unix://"):
+        return UnixSocketTransport(urlparse(redis_url).path)
+    if redis_url.startswith("redis://"):
+        parts = redis_url.replace("redis://", "").split(":")
+        host = parts[0] if len(parts) > 0 else "localhost"
+        port = int(parts[1]) if len(parts) > 1 else 6379
+        return TCPTransport(host, port)
+    return TCPTransport()
+
 
 class CoordinationClient:
     """Main client for coordinating multiple agents via Redis."""
@@ -16,42 +139,50 @@ class CoordinationClient:
     def __init__(
         self,
         redis_url: str = "redis://localhost:6379",
-        fallback_dir: Optional[str] = None
+        fallback_dir: Optional[str] = None,
+        decision_batch_size: int = 1,
+        connection_pool: Optional[redis.ConnectionPool] = None,
+        transport: Optional[Transport] = None
     ):
         """Initialize coordination client.
 
         Args:
-            redis_url: Redis connection URL
+            redis_url: Redis connection URL, redis://host:port or
+                unix:///path/to/redis.sock
             fallback_dir: Directory for file-based fallback (unused, for compatibility)
+            decision_batch_size: Buffer this many decisions and write them in one
+                pipeline (1 writes each decision immediately)
+            connection_pool: Shared Redis connection pool to use instead of
+                connecting to redis_url; create it with decode_responses=True.
+                The pool is left open on shutdown.
+            transport: How to probe and connect to Redis; defaults to the
+                transport for redis_url. Ignored when connection_pool is given.
         """
-        # Parse redis URL
-        if redis_url.startswith("redis://"):
-            parts = redis_url.replace("redis://", "").split(":")
-            host = parts[0] if len(parts) > 0 else "localhost"
-            port = int(parts[1]) if len(parts) > 1 else 6379
+        self.fallback_dir = fallback_dir
+        if connection_pool is not None:
+            transport = None
+            self.redis_client = redis.Redis(connection_pool=connection_pool)
         else:
-            host = "localhost"
-            port = 6379
-
-        self.redis_client = redis.Redis(
-            host=host,
-            port=port,
-            decode_responses=True
-        )
+            transport = transport or transport_for_url(redis_url)
+            self.redis_client = transport.connect() if transport.probe() else None
 
         # Test connection
-        try:
-            self.redis_client.ping()
-            self.mode = "redis"
-        except redis.ConnectionError:
-            self.mode = "fallback"
-            self.redis_client = None
+        self.mode = "fallback"
+        if self.redis_client is not None:
+            try:
+                self.redis_client.ping()
+                self.mode = "redis"
+            except redis.ConnectionError:
+                self.redis_client = None
+                if transport is not None:
+                    # A cached success went stale; later clients should fail fast
+                    transport.mark_unreachable()
 
         # Initialize components
         if self.redis_client:
             # TaskQueue uses SQLite, not Redis (fix for type mismatch)
             db_path = fallback_dir + "/tasks.db" if fallback_dir else "agentcoord_tasks.db"
-            self.task_queue = TaskQueue(db_path)
+            self.task_queue = TaskQueue(db_path, redis_client=self.redis_client)
             self.board = Board(self.redis_client)
             self.agent_registry = AgentRegistry(self.redis_client)
             self.audit_log = AuditLog(self.redis_client)
@@ -63,9 +194,19 @@ class CoordinationClient:
             self.audit_log = None
 
         self.agent_id = None
+        self.decision_batch_size = decision_batch_size
+        self._pending_decisions: List[Tuple[str, str, str, str, str]] = []
+
+    @staticmethod
+    def clear_probe_cache():
+        """Forget cached probe results so the next client probes again."""
+        _probe_results.clear()
 
     @classmethod
-    def session(cls, redis_url: str, role: str, name: str, working_on: str = "", fallback_dir: Optional[str] = None):
+    def session(cls, redis_url: str, role: str, name: str, working_on: str = "",
+                fallback_dir: Optional[str] = None, decision_batch_size: int = 1,
+                connection_pool: Optional[redis.ConnectionPool] = None,
+                transport: Optional[Transport] = None):
         """Create a client session with auto-registration.
 
         Args:
@@ -74,11 +215,16 @@ class CoordinationClient:
             name: Agent name
             working_on: Current task description
             fallback_dir: Directory for file-based fallback
+            decision_batch_size: Decisions buffered per audit log write
+            connection_pool: Shared Redis connection pool
+            transport: How to probe and connect to Redis
 
         Returns:
             CoordinationClient instance
         """
-        client = cls(redis_url=redis_url, fallback_dir=fallback_dir)
+        client = cls(redis_url=redis_url, fallback_dir=fallback_dir,
+                     decision_batch_size=decision_batch_size,
+                     connection_pool=connection_pool, transport=transport)
         client.register_agent(role=role, name=name, working_on=working_on)
         return client
 
@@ -167,18 +313,30 @@ class CoordinationClient:
             context: Decision context
             reason: Reason for decision
         """
-        if self.audit_log:
-            self.audit_log.log(
-                agent_id=self.agent_id or "unknown",
-                action=decision_type,
-                details={
-                    "context": context,
-                    "reason": reason
-                }
-            )
+        if not self.audit_log:
+            return
+
+        agent_id = self.agent_id or "unknown"
+        if self.decision_batch_size <= 1:
+            self.audit_log.log_decision(agent_id, decision_type, context, reason)
+            return
+
+        # Stamp now so buffered entries keep the time they were made
+        timestamp = datetime.now(timezone.utc).isoformat()
+        self._pending_decisions.append((agent_id, decision_type, context, reason, timestamp))
+        if len(self._pending_decisions) >= self.decision_batch_size:
+            self.flush_decisions()
+
+    def flush_decisions(self):
+        """Write any buffered decisions to the audit log."""
+        if self.audit_log and self._pending_decisions:
+            pending, self._pending_decisions = self._pending_decisions, []
+            self.audit_log.log_decisions(pending)
 
     def shutdown(self):
         """Cleanup and close connections."""
+        self.flush_decisions()
+
         if self.agent_registry and self.agent_id:
             self.agent_registry.unregister(self.agent_id)
 
@@ -6,8 +6,8 @@ with user preferences for cost/quality optimization.
 """
 
 import json
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Tuple, Union
+from dataclasses import dataclass, asdict, replace
 from enum import Enum
 import logging
 
@@ -89,6 +89,21 @@ class ExecutionPlan:
         return d
 
 
+@dataclass
+class PreparedPlan:
+    """
+    Mode-independent analysis of a task list.
+
+    Built once by TaskPlanner.prepare() and passed to create_execution_plan()
+    for each optimization mode, so dependency leveling and complexity
+    scoring are not repeated per mode.
+    """
+    tasks: List[Dict]
+    complexities: List[TaskComplexity]  # Baseline analysis, copied before mode adjustments
+    levels: List[List[int]]  # Task indices grouped into waves that can run in parallel
+    dependents: List[List[int]]  # Task index -> indices of tasks that depend on it
+
+
 class TaskPlanner:
     """
     Analyzes tasks and generates optimized execution plans.
@@ -116,7 +131,10 @@ class TaskPlanner:
 
     def __init__(self):
         """Initialize task planner."""
-        pass
+        # Last prepared plan and the task contents it was built from, so
+        # re-planning an unchanged task list skips the analysis
+        self._prepared_key: Optional[Tuple] = None
+        self._prepared: Optional[PreparedPlan] = None
 
     def analyze_task_complexity(self, task: Dict) -> TaskComplexity:
         """
@@ -221,9 +239,46 @@ class TaskPlanner:
             return 5
         return 2
 
+    def prepare(self, tasks: List[Dict]) -> PreparedPlan:
+        """
+        Analyze tasks and level their dependency graph once.
+
+        The result can be passed to create_execution_plan() for any number
+        of optimization modes.
+
+        Args:
+            tasks: List of task dictionaries
+
+        Returns:
+            PreparedPlan holding complexities and parallel levels
+        """
+        key = self._tasks_key(tasks)
+        if key == self._prepared_key:
+            return self._prepared
+
+        complexities = [self.analyze_task_complexity(task) for task in tasks]
+        levels, dependents = self._level_tasks(tasks)
+        prepared = PreparedPlan(
+            tasks=tasks,
+            complexities=complexities,
+            levels=levels,
+            dependents=dependents
+        )
+        self._prepared_key, self._prepared = key, prepared
+        return prepared
+
+    @staticmethod
+    def _tasks_key(tasks: List[Dict]) -> Tuple:
+        """Snapshot of every task field the analysis reads."""
+        return tuple(
+            (task.get('id'), task.get('title', ''), task.get('description', ''),
+             tuple(task.get('depends_on') or ()), tuple(task.get('tags') or ()))
+            for task in tasks
+        )
+
     def create_execution_plan(
         self,
-        tasks: List[Dict],
+        tasks: Union[List[Dict], PreparedPlan],
         optimization_mode: OptimizationMode = OptimizationMode.BALANCED,
         budget_limit: Optional[float] = None,
         max_agents: int = 10
@@ -232,7 +287,7 @@ class TaskPlanner:
         Create optimized execution plan for tasks.
 
         Args:
-            tasks: List of task dictionaries
+            tasks: List of task dictionaries, or the result of prepare()
             optimization_mode: User preference for cost/quality
             budget_limit: Optional budget limit in dollars
             max_agents: Maximum agents to spawn
@@ -240,8 +295,11 @@ class TaskPlanner:
         Returns:
             ExecutionPlan with recommendations
         """
-        # Analyze each task
-        complexities = [self.analyze_task_complexity(task) for task in tasks]
+        prepared = tasks if isinstance(tasks, PreparedPlan) else self.prepare(tasks)
+        tasks = prepared.tasks
+
+        # Copy the baseline analysis so mode adjustments don't leak between plans
+        complexities = [replace(tc) for tc in prepared.complexities]
 
         # Apply optimization mode adjustments
         if optimization_mode == OptimizationMode.COST:
@@ -264,17 +322,22 @@ class TaskPlanner:
                 # Recalculate cost
                 tc.estimated_cost = (tc.estimated_tokens / 1_000_000) * self.MODEL_PRICING[tc.recommended_model]
 
-        # Calculate totals
-        total_tokens = sum(tc.estimated_tokens for tc in complexities)
-        total_cost = sum(tc.estimated_cost for tc in complexities)
+        # Calculate totals and model distribution in a single pass
+        total_tokens = 0
+        total_cost = 0.0
+        model_distribution = {tier.value: 0 for tier in ModelTier}
+        for tc in complexities:
+            total_tokens += tc.estimated_tokens
+            total_cost += tc.estimated_cost
+            model_distribution[tc.recommended_model.value] += 1
 
-        # Determine parallelization groups
-        parallel_groups = self._plan_parallelization(tasks, complexities)
+        # Parallelization groups come from the prepared levels
+        parallel_groups = [[tasks[i]['id'] for i in level] for level in prepared.levels]
 
         # Calculate duration (parallel groups run concurrently)
         total_duration = sum(
-            max(complexities[i].estimated_duration_minutes for i in range(len(tasks)) if tasks[i]['id'] in group)
-            for group in parallel_groups
+            max(complexities[i].estimated_duration_minutes for i in level)
+            for level in prepared.levels
         )
 
         # Determine optimal agent count
@@ -284,13 +347,6 @@ class TaskPlanner:
             max(len(parallel_groups[0]) if parallel_groups else 1, (len(tasks) + 1) // 2)
         )
 
-        # Model distribution
-        model_distribution = {
-            ModelTier.HAIKU.value: sum(1 for tc in complexities if tc.recommended_model == ModelTier.HAIKU),
-            ModelTier.SONNET.value: sum(1 for tc in complexities if tc.recommended_model == ModelTier.SONNET),
-            ModelTier.OPUS.value: sum(1 for tc in complexities if tc.recommended_model == ModelTier.OPUS),
-        }
-
         # Budget check
         within_budget = True
         if budget_limit is not None and total_cost > budget_limit:
@@ -314,37 +370,51 @@ class TaskPlanner:
             parallel_groups=parallel_groups
         )
 
-    def _plan_parallelization(self, tasks: List[Dict], complexities: List[TaskComplexity]) -> List[List[str]]:
+    def _level_tasks(self, tasks: List[Dict]) -> Tuple[List[List[int]], List[List[int]]]:
         """
-        Plan parallel execution groups based on dependencies.
+        Group tasks into parallel execution levels based on dependencies.
 
         Returns:
-            List of groups, where each group contains task IDs that can run in parallel
+            (levels, dependents) where each level lists task indices that can
+            run in parallel, and dependents maps a task index to the indices
+            of tasks waiting on it
         """
-        # Build dependency graph
-        task_deps = {task['id']: set(task.get('depends_on', [])) for task in tasks}
-        task_ids = [task['id'] for task in tasks]
-
-        # Topological sort into levels (simple version)
-        groups = []
-        remaining = set(task_ids)
-
-        while remaining:
-            # Find tasks with no unmet dependencies
-            ready = {
-                tid for tid in remaining
-                if not (task_deps[tid] & remaining)  # No dependencies in remaining
-            }
-
-            if not ready:
-                # Circular dependency or error, just add all remaining
-                groups.append(list(remaining))
-                break
-
-            groups.append(list(ready))
-            remaining -= ready
-
-        return groups if groups else [[tid] for tid in task_ids]
+        # Common case: no dependencies at all, so every task is in one level
+        if not any(task.get('depends_on') for task in tasks):
+            levels = [list(range(len(tasks)))] if tasks else []
+            return levels, [[] for _ in tasks]
+
+        # Build dependency graph; dependencies outside the task list are ignored
+        index_by_id = {task['id']: i for i, task in enumerate(tasks)}
+        dependents = [[] for _ in tasks]
+        in_degree = [0] * len(tasks)
+        for i, task in enumerate(tasks):
+            for dep_id in set(task.get('depends_on') or []):
+                dep = index_by_id.get(dep_id)
+                if dep is not None:
+                    dependents[dep].append(i)
+                    in_degree[i] += 1
+
+        # Kahn's algorithm, one level at a time
+        levels = []
+        ready = [i for i, degree in enumerate(in_degree) if degree == 0]
+        placed = 0
+        while ready:
+            levels.append(ready)
+            placed += len(ready)
+            next_ready = []
+            for i in ready:
+                for child in dependents[i]:
+                    in_degree[child] -= 1
+                    if in_degree[child] == 0:
+                        next_ready.append(child)
+            ready = sorted(next_ready)
+
+        if placed < len(tasks):
+            # Circular dependency, just add all remaining
+            levels.append([i for i, degree in enumerate(in_degree) if degree > 0])
+
+        return levels, dependents
 
 
 def format_plan_summary(plan: ExecutionPlan) -> str:
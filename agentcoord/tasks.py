@@ -1,11 +1,15 @@
 import sqlite3
 import json
+import logging
+import os
 import uuid
 from datetime import datetime
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+logger = logging.getLogger(__name__)
+
 class TaskStatus(Enum):
     PENDING = "pending"
     CLAIMED = "claimed"
@@ -24,6 +28,8 @@ class Task:
     updated_at: str = ""
     result: Optional[str] = None
     depends_on: List[str] = None  # New field for task dependencies
+    priority: int = 0  # Higher priorities are claimed first
+    tags: List[str] = None  # Agents claiming with tags only get tasks sharing one
     
     def __post_init__(self):
         if not self.created_at:
@@ -32,11 +38,126 @@ class Task:
             self.updated_at = self.created_at
         if self.depends_on is None:
             self.depends_on = []
+        if self.tags is None:
+            self.tags = []
+
+# Pub/sub channel that receives {"task_id", "old", "new"} on every status change
+TASK_STATUS_CHANNEL = "task.status"
+
+# Prefix of the per-database hash of status -> task count. Each queue uses
+# "task.counts:<absolute db path>", seeded from SQLite when the queue opens
+# and kept current with HINCRBY on every change
+TASK_COUNTS_KEY = "task.counts"
+
+_INSERT_TASK_SQL = '''
+    INSERT INTO tasks (id, title, description, status, agent_id,
+                       created_at, updated_at, result, depends_on,
+                       priority, tags)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+_INSERT_TAG_SQL = 'INSERT OR IGNORE INTO task_tags (tag, task_id) VALUES (?, ?)'
+
+def _task_row(task: Task) -> tuple:
+    """Column values for inserting a task."""
+    return (
+        task.id, task.title, task.description, task.status.value,
+        task.agent_id, task.created_at, task.updated_at, task.result,
+        json.dumps(task.depends_on), task.priority, json.dumps(task.tags)
+    )
+
+def _row_to_task(row: sqlite3.Row) -> Task:
+    """Build a Task from a tasks table row."""
+    return Task(
+        id=row['id'],
+        title=row['title'],
+        description=row['description'],
+        status=TaskStatus(row['status']),
+        agent_id=row['agent_id'],
+        created_at=row['created_at'],
+        updated_at=row['updated_at'],
+        result=row['result'],
+        depends_on=json.loads(row['depends_on'] or '[]'),
+        priority=row['priority'],
+        tags=json.loads(row['tags'] or '[]')
+    )
 
 class TaskQueue:
-    def __init__(self, db_path: str = "tasks.db"):
+    def __init__(self, db_path: str = "tasks.db", redis_client=None):
         self.db_path = db_path
+        # Optional: when set, status changes are published on TASK_STATUS_CHANNEL
+        self.redis_client = redis_client
+        self._counts_key = f"{TASK_COUNTS_KEY}:{os.path.abspath(db_path)}"
         self._init_db()
+        self._rebuild_status_counts()
+    
+    def _publish_status(self, task_id: str, old: str, new: str):
+        """Announce a status change so monitors don't have to poll the table."""
+        if self.redis_client is None:
+            return
+        # Counts and the announcement go in one MULTI so readers never see them disagree
+        pipe = self.redis_client.pipeline()
+        pipe.hincrby(self._counts_key, old, -1)
+        pipe.hincrby(self._counts_key, new, 1)
+        pipe.publish(
+            TASK_STATUS_CHANNEL, json.dumps({"task_id": task_id, "old": old, "new": new})
+        )
+        try:
+            pipe.execute()
+        except Exception as e:
+            # The row is already committed; a lost announcement must not fail the call
+            logger.error(f"Failed to publish status change for task {task_id}: {e}")
+    
+    def _count_created(self, tasks: List[Task]):
+        """Add newly created tasks to the status counts."""
+        if self.redis_client is None or not tasks:
+            return
+        pipe = self.redis_client.pipeline()
+        for task in tasks:
+            pipe.hincrby(self._counts_key, task.status.value, 1)
+        try:
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to count {len(tasks)} new tasks: {e}")
+    
+    def _count_statuses(self) -> Dict[str, int]:
+        """Count tasks in each status straight from SQLite."""
+        with sqlite3.connect(self.db_path) as conn:
+            return dict(conn.execute('SELECT status, COUNT(*) FROM tasks GROUP BY status'))
+    
+    def _rebuild_status_counts(self):
+        """Reseed the Redis counts cache from the tasks table.
+        
+        Queues opened without a redis_client change tasks without updating
+        the cache, so it is rebuilt whenever a Redis-backed queue opens.
+        """
+        if self.redis_client is None:
+            return
+        counts = self._count_statuses()
+        pipe = self.redis_client.pipeline()
+        pipe.delete(self._counts_key)
+        if counts:
+            pipe.hset(self._counts_key, mapping=counts)
+        try:
+            pipe.execute()
+        except Exception as e:
+            logger.error(f"Failed to rebuild task status counts: {e}")
+    
+    def get_status_counts(self) -> Dict[str, int]:
+        """Get the number of tasks in each status.
+        
+        Reads the Redis counts cache when there is a redis_client. The cache
+        is reseeded from SQLite when a Redis-backed queue opens, so it can lag
+        changes made since then through queues without Redis. Counts come
+        from SQLite without Redis or when Redis cannot be read.
+        """
+        if self.redis_client is not None:
+            try:
+                counts = self.redis_client.hgetall(self._counts_key)
+                return {status: int(count) for status, count in counts.items()}
+            except Exception as e:
+                logger.error(f"Failed to read task status counts: {e}")
+        return self._count_statuses()
     
     def _init_db(self):
         with sqlite3.connect(self.db_path) as conn:
@@ -50,13 +171,34 @@ class TaskQueue:
                     created_at TEXT NOT NULL,
                     updated_at TEXT NOT NULL,
                     result TEXT,
-                    depends_on TEXT  -- JSON array of task IDs
+                    depends_on TEXT,  -- JSON array of task IDs
+                    priority INTEGER NOT NULL DEFAULT 0,
+                    tags TEXT  -- JSON array of tags
+                )
+            ''')
+            # Databases created before priority and tags existed
+            columns = {row[1] for row in conn.execute('PRAGMA table_info(tasks)')}
+            if 'priority' not in columns:
+                conn.execute('ALTER TABLE tasks ADD COLUMN priority INTEGER NOT NULL DEFAULT 0')
+            if 'tags' not in columns:
+                conn.execute('ALTER TABLE tasks ADD COLUMN tags TEXT')
+            # Tag index, so a tagged claim only looks at tasks carrying its tags
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS task_tags (
+                    tag TEXT NOT NULL,
+                    task_id TEXT NOT NULL,
+                    PRIMARY KEY (tag, task_id)
                 )
             ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_tasks_claim_order
+                ON tasks (status, priority DESC, created_at)
+            ''')
             conn.commit()
     
-    def create_task(self, title: str, description: str, depends_on: List[str] = None) -> Task:
-        """Create a new task with optional dependencies."""
+    def create_task(self, title: str, description: str, depends_on: List[str] = None,
+                    priority: int = 0, tags: List[str] = None) -> Task:
+        """Create a new task with optional dependencies, priority and tags."""
         task_id = str(uuid.uuid4())
         depends_on = depends_on or []
         
@@ -77,23 +219,58 @@ class TaskQueue:
             title=title,
             description=description,
             status=status,
-            depends_on=depends_on
+            depends_on=depends_on,
+            priority=priority,
+            tags=list(tags or [])
         )
         
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                INSERT INTO tasks (id, title, description, status, agent_id, 
-                                 created_at, updated_at, result, depends_on)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                task.id, task.title, task.description, task.status.value,
-                task.agent_id, task.created_at, task.updated_at, task.result,
-                json.dumps(task.depends_on)
-            ))
+            conn.execute(_INSERT_TASK_SQL, _task_row(task))
+            conn.executemany(_INSERT_TAG_SQL, [(tag, task.id) for tag in task.tags])
             conn.commit()
         
+        self._count_created([task])
         return task
     
+    def create_tasks_bulk(self, task_defs: List[Dict[str, Any]]) -> List[Task]:
+        """Create several tasks in a single transaction.
+        
+        Each entry holds create_task keyword arguments. Dependencies must
+        refer to tasks that already exist.
+        """
+        tasks = []
+        all_deps = set()
+        for task_def in task_defs:
+            depends_on = list(task_def.get('depends_on') or [])
+            all_deps.update(depends_on)
+            tasks.append(Task(
+                id=str(uuid.uuid4()),
+                title=task_def['title'],
+                description=task_def['description'],
+                status=TaskStatus.BLOCKED if depends_on else TaskStatus.PENDING,
+                depends_on=depends_on,
+                priority=task_def.get('priority', 0),
+                tags=list(task_def.get('tags') or [])
+            ))
+        
+        with sqlite3.connect(self.db_path) as conn:
+            # Validate all dependencies with one query instead of one lookup each
+            if all_deps:
+                placeholders = ','.join('?' * len(all_deps))
+                cursor = conn.execute(
+                    f'SELECT id FROM tasks WHERE id IN ({placeholders})', list(all_deps)
+                )
+                missing = all_deps - {row[0] for row in cursor}
+                if missing:
+                    raise ValueError(f"Dependency task {sorted(missing)[0]} does not exist")
+            
+            conn.executemany(_INSERT_TASK_SQL, [_task_row(task) for task in tasks])
+            conn.executemany(_INSERT_TAG_SQL, [(tag, task.id) for task in tasks for tag in task.tags])
+            conn.commit()
+        
+        self._count_created(tasks)
+        return tasks
+    
     def get_task(self, task_id: str) -> Optional[Task]:
         """Get a task by ID."""
         with sqlite3.connect(self.db_path) as conn:
@@ -104,17 +281,7 @@ class TaskQueue:
             if not row:
                 return None
             
-            return Task(
-                id=row['id'],
-                title=row['title'],
-                description=row['description'],
-                status=TaskStatus(row['status']),
-                agent_id=row['agent_id'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at'],
-                result=row['result'],
-                depends_on=json.loads(row['depends_on'] or '[]')
-            )
+            return _row_to_task(row)
     
     def get_ready_tasks(self) -> List[Task]:
         """Get tasks that are ready to be claimed (no unmet dependencies)."""
@@ -125,17 +292,7 @@ class TaskQueue:
             
             ready_tasks = []
             for row in rows:
-                task = Task(
-                    id=row['id'],
-                    title=row['title'],
-                    description=row['description'],
-                    status=TaskStatus(row['status']),
-                    agent_id=row['agent_id'],
-                    created_at=row['created_at'],
-                    updated_at=row['updated_at'],
-                    result=row['result'],
-                    depends_on=json.loads(row['depends_on'] or '[]')
-                )
+                task = _row_to_task(row)
                 
                 # Check if all dependencies are completed
                 if self._dependencies_completed(task.depends_on):
@@ -143,33 +300,66 @@ class TaskQueue:
             
             return ready_tasks
     
-    def claim_task(self, agent_id: str) -> Optional[Task]:
-        """Claim an available task, respecting dependencies."""
-        ready_tasks = self.get_ready_tasks()
+    def claim_task(self, agent_id: str, tags: Optional[List[str]] = None) -> Optional[Task]:
+        """Claim an available task, respecting dependencies.
         
-        if not ready_tasks:
-            return None
-        
-        # Claim the first ready task
-        task = ready_tasks[0]
-        task.status = TaskStatus.CLAIMED
-        task.agent_id = agent_id
-        task.updated_at = datetime.now().isoformat()
+        Tasks are claimed highest priority first. With tags, only tasks
+        carrying at least one of them are considered, found through the
+        tag index rather than by scanning every pending task.
         
+        Candidate lookup and the claim share one connection and transaction,
+        and the claim only succeeds while the task is still pending, so two
+        agents racing for the same task cannot both get it.
+        """
         with sqlite3.connect(self.db_path) as conn:
-            conn.execute('''
-                UPDATE tasks SET status = ?, agent_id = ?, updated_at = ?
-                WHERE id = ?
-            ''', (task.status.value, task.agent_id, task.updated_at, task.id))
-            conn.commit()
+            conn.row_factory = sqlite3.Row
+            if tags:
+                placeholders = ','.join('?' * len(tags))
+                cursor = conn.execute(f'''
+                    SELECT * FROM tasks WHERE status = ? AND id IN (
+                        SELECT task_id FROM task_tags WHERE tag IN ({placeholders})
+                    )
+                    ORDER BY priority DESC, created_at
+                ''', [TaskStatus.PENDING.value, *tags])
+            else:
+                cursor = conn.execute(
+                    'SELECT * FROM tasks WHERE status = ? ORDER BY priority DESC, created_at',
+                    (TaskStatus.PENDING.value,)
+                )
+            
+            for row in cursor.fetchall():
+                depends_on = json.loads(row['depends_on'] or '[]')
+                if not self._dependencies_completed(depends_on, conn):
+                    continue
+                
+                updated_at = datetime.now().isoformat()
+                claimed = conn.execute('''
+                    UPDATE tasks SET status = ?, agent_id = ?, updated_at = ?
+                    WHERE id = ? AND status = ?
+                ''', (TaskStatus.CLAIMED.value, agent_id, updated_at,
+                      row['id'], TaskStatus.PENDING.value))
+                if claimed.rowcount != 1:
+                    # Another agent claimed it since the SELECT
+                    continue
+                conn.commit()
+                
+                task = _row_to_task(row)
+                task.status = TaskStatus.CLAIMED
+                task.agent_id = agent_id
+                task.updated_at = updated_at
+                break
+            else:
+                return None
         
+        self._publish_status(task.id, TaskStatus.PENDING.value, task.status.value)
         return task
     
     def complete_task(self, task_id: str, result: str = None) -> bool:
         """Mark a task as completed and check for newly available tasks."""
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
-            if not cursor.fetchone():
+            cursor = conn.execute('SELECT status FROM tasks WHERE id = ?', (task_id,))
+            row = cursor.fetchone()
+            if not row:
                 return False
             
             # Update task status
@@ -179,16 +369,20 @@ class TaskQueue:
             ''', (TaskStatus.COMPLETED.value, result, datetime.now().isoformat(), task_id))
             
             # Check for newly available tasks
-            self._update_blocked_tasks(conn)
+            unblocked = self._update_blocked_tasks(conn)
             conn.commit()
-            
+        
+        self._publish_status(task_id, row[0], TaskStatus.COMPLETED.value)
+        for unblocked_id in unblocked:
+            self._publish_status(unblocked_id, TaskStatus.BLOCKED.value, TaskStatus.PENDING.value)
         return True
     
     def fail_task(self, task_id: str, error: str = None) -> bool:
         """Mark a task as failed."""
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute('SELECT * FROM tasks WHERE id = ?', (task_id,))
-            if not cursor.fetchone():
+            cursor = conn.execute('SELECT status FROM tasks WHERE id = ?', (task_id,))
+            row = cursor.fetchone()
+            if not row:
                 return False
             
             conn.execute('''
@@ -196,7 +390,8 @@ class TaskQueue:
                 WHERE id = ?
             ''', (TaskStatus.FAILED.value, error, datetime.now().isoformat(), task_id))
             conn.commit()
-            
+        
+        self._publish_status(task_id, row[0], TaskStatus.FAILED.value)
         return True
     
     def get_all_tasks(self) -> List[Task]:
@@ -206,17 +401,7 @@ class TaskQueue:
             cursor = conn.execute('SELECT * FROM tasks ORDER BY created_at')
             rows = cursor.fetchall()
             
-            return [Task(
-                id=row['id'],
-                title=row['title'],
-                description=row['description'],
-                status=TaskStatus(row['status']),
-                agent_id=row['agent_id'],
-                created_at=row['created_at'],
-                updated_at=row['updated_at'],
-                result=row['result'],
-                depends_on=json.loads(row['depends_on'] or '[]')
-            ) for row in rows]
+            return [_row_to_task(row) for row in rows]
     
     def get_dependency_graph(self) -> Dict[str, Dict[str, Any]]:
         """Get the dependency graph for visualization."""
@@ -239,32 +424,42 @@ class TaskQueue:
         
         return graph
     
-    def _dependencies_completed(self, depends_on: List[str]) -> bool:
-        """Check if all dependencies are completed."""
+    def _dependencies_completed(self, depends_on: List[str], conn=None) -> bool:
+        """Check if all dependencies are completed.
+        
+        Pass conn to check within an open transaction instead of opening a
+        new connection.
+        """
         if not depends_on:
             return True
         
-        with sqlite3.connect(self.db_path) as conn:
-            placeholders = ','.join('?' * len(depends_on))
-            cursor = conn.execute(f'''
-                SELECT COUNT(*) FROM tasks 
-                WHERE id IN ({placeholders}) AND status = ?
-            ''', depends_on + [TaskStatus.COMPLETED.value])
-            
-            completed_count = cursor.fetchone()[0]
-            return completed_count == len(depends_on)
+        if conn is None:
+            with sqlite3.connect(self.db_path) as conn:
+                return self._dependencies_completed(depends_on, conn)
+        
+        placeholders = ','.join('?' * len(depends_on))
+        cursor = conn.execute(f'''
+            SELECT COUNT(*) FROM tasks 
+            WHERE id IN ({placeholders}) AND status = ?
+        ''', depends_on + [TaskStatus.COMPLETED.value])
+        
+        completed_count = cursor.fetchone()[0]
+        return completed_count == len(depends_on)
     
-    def _update_blocked_tasks(self, conn):
-        """Update blocked tasks that may now be ready."""
+    def _update_blocked_tasks(self, conn) -> List[str]:
+        """Update blocked tasks that may now be ready; returns their IDs."""
         cursor = conn.execute('SELECT * FROM tasks WHERE status = ?', (TaskStatus.BLOCKED.value,))
         blocked_tasks = cursor.fetchall()
         
+        unblocked = []
         for row in blocked_tasks:
             depends_on = json.loads(row[8] or '[]')  # depends_on column
-            if self._dependencies_completed(depends_on):
+            if self._dependencies_completed(depends_on, conn):
                 conn.execute('''
                     UPDATE tasks SET status = ?, updated_at = ? WHERE id = ?
                 ''', (TaskStatus.PENDING.value, datetime.now().isoformat(), row[0]))
+                unblocked.append(row[0])
+        return unblocked
     
     def _has_circular_dependency(self, task_id: str, depends_on: List[str], visited: set = None) -> bool:
         """Check for circular dependencies using DFS."""
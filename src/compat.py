@@ -0,0 +1,6 @@
+"""Helpers for differences between supported Python versions."""
+import sys
+
+# Keyword arguments for @dataclass: slots=True needs Python 3.10+, and older
+# interpreters keep a per-instance __dict__
+SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
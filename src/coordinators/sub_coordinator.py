@@ -1,19 +1,25 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional, Any, Set
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from datetime import datetime
 import asyncio
+import json
 import logging
+import random
+import time
+import uuid
+from collections import OrderedDict, deque
 from concurrent.futures import ThreadPoolExecutor
 
 from ..models.task import Task, TaskStatus, SubProject
 from ..models.worker import Worker, WorkerStatus
 from ..communication.message_bus import MessageBus, Message, MessageType
 from ..interfaces.coordinator import BaseCoordinator
+from ..compat import SLOTS
 
 
-@dataclass
+@dataclass(**SLOTS)
 class TeamMetrics:
     """Metrics for worker team performance"""
     total_workers: int = 0
@@ -24,7 +30,7 @@ class TeamMetrics:
     current_load: float = 0.0
 
 
-@dataclass
+@dataclass(**SLOTS)
 class StatusReport:
     """Status report for upward communication"""
     coordinator_id: str
@@ -50,7 +56,15 @@ class SubCoordinator(BaseCoordinator):
         sub_project: SubProject,
         message_bus: MessageBus,
         max_workers: int = 10,
-        report_interval: int = 30
+        report_interval: int = 30,
+        gossip_fanout: int = 3,
+        gossip_ttl: int = 3,
+        view_size: int = 8,
+        view_shuffle_interval: float = 15.0,
+        completed_history_size: int = 10_000,
+        archive_path: Optional[str] = None,
+        archive_batch_size: int = 100,
+        archive_flush_interval: float = 60.0
     ):
         self.coordinator_id = coordinator_id
         self.sub_project = sub_project
@@ -60,14 +74,44 @@ class SubCoordinator(BaseCoordinator):
         
         # Worker management
         self.workers: Dict[str, Worker] = {}
-        self.task_queue: asyncio.Queue[Task] = asyncio.Queue()
+        # Bounded so breakdown backpressures instead of growing without limit;
+        # requeues that find it full spill into the overflow deque
+        self.task_queue: asyncio.Queue[Task] = asyncio.Queue(maxsize=4 * max_workers)
+        self._task_overflow: deque = deque()
         self.active_tasks: Dict[str, Task] = {}
-        self.completed_tasks: List[Task] = []
+        self.completed_tasks: deque = deque(maxlen=completed_history_size)
+        
+        # Running totals so metrics stay O(1) regardless of history size
+        self._completion_time_sum = 0.0
+        self._completion_time_count = 0
+        self._completion_count = 0
+        self._total_created = 0
+        # Monotonic start times of active tasks, so durations are plain float math
+        self._task_started_at: Dict[str, float] = {}
+        self._success_count = 0
+        
+        # Tasks evicted from the in-memory history are appended to an archive log
+        self.archive_path = archive_path
+        self.archive_batch_size = archive_batch_size
+        self.archive_flush_interval = archive_flush_interval
+        self._archive_buffer: List[Dict[str, Any]] = []
+        self._last_archive_flush = datetime.now()
         
         # Peer coordination
         self.peer_coordinators: Set[str] = set()
         self.shared_resources: Dict[str, Any] = {}
         
+        # Gossip: requests go to a few peers from a small partial view and are
+        # forwarded hop by hop instead of being broadcast to every peer
+        self.gossip_fanout = gossip_fanout
+        self.gossip_ttl = gossip_ttl
+        self.view_size = view_size
+        self.view_shuffle_interval = view_shuffle_interval
+        self._view: List[str] = []
+        self._seen_gossip: OrderedDict = OrderedDict()
+        self._max_seen_gossip = 1024
+        self.peer_cards: Dict[str, Dict[str, Any]] = {}
+        
         # Status tracking
         self.last_report_time = datetime.now()
         self.metrics = TeamMetrics()
@@ -78,6 +122,13 @@ class SubCoordinator(BaseCoordinator):
         
         self.logger = logging.getLogger(f"SubCoordinator-{coordinator_id}")
         
+        # Message type -> handler, so dispatch is one dict lookup
+        self._handlers = {
+            MessageType.RESOURCE_REQUEST: self._handle_resource_request,
+            MessageType.RESOURCE_OFFER: self._handle_resource_offer,
+            MessageType.PEER_COORDINATION: self._handle_peer_coordination
+        }
+        
         # Subscribe to relevant messages
         self._setup_message_handlers()
     
@@ -91,7 +142,8 @@ class SubCoordinator(BaseCoordinator):
             asyncio.create_task(self._task_distribution_loop()),
             asyncio.create_task(self._status_reporting_loop()),
             asyncio.create_task(self._health_monitoring_loop()),
-            asyncio.create_task(self._message_processing_loop())
+            asyncio.create_task(self._message_processing_loop()),
+            asyncio.create_task(self._view_shuffle_loop())
         ]
         
         await asyncio.gather(*tasks)
@@ -102,8 +154,12 @@ class SubCoordinator(BaseCoordinator):
         self.logger.info(f"Stopping SubCoordinator {self.coordinator_id}")
         
         # Cleanup workers
-        for worker in self.workers.values():
-            await worker.stop()
+        await asyncio.gather(*(worker.stop() for worker in self.workers.values()))
+        
+        # Snapshot remaining history so nothing is lost on shutdown
+        for task in self.completed_tasks:
+            await self._archive_task(task)
+        await self._flush_archive()
         
         self.executor.shutdown(wait=True)
     
@@ -115,9 +171,10 @@ class SubCoordinator(BaseCoordinator):
             # Break down sub-project into tasks
             tasks = await self._breakdown_sub_project(sub_project)
             
-            # Add tasks to queue
+            # Add tasks to queue; awaiting put() would hang on a full queue
+            # before the distribution loop is running
             for task in tasks:
-                await self.task_queue.put(task)
+                self._requeue_task(task)
             
             self.logger.info(f"Created {len(tasks)} tasks from sub-project {sub_project.project_id}")
             
@@ -155,32 +212,111 @@ class SubCoordinator(BaseCoordinator):
         for task in tasks_to_reassign:
             task.assigned_worker_id = None
             task.status = TaskStatus.PENDING
-            await self.task_queue.put(task)
+            self._requeue_task(task)
             del self.active_tasks[task.task_id]
+            self._task_started_at.pop(task.task_id, None)
         
         self.logger.info(f"Removed worker {worker_id} and reassigned {len(tasks_to_reassign)} tasks")
         self._update_team_metrics()
         return True
     
     async def request_peer_assistance(self, resource_type: str, requirements: Dict[str, Any]) -> bool:
-        """Request assistance from peer coordinators"""
+        """Request assistance from peer coordinators via gossip"""
+        gossip_id = uuid.uuid4().hex
+        self._mark_gossip_seen(gossip_id)
+        
         message = Message(
             message_type=MessageType.RESOURCE_REQUEST,
             sender_id=self.coordinator_id,
             data={
                 'resource_type': resource_type,
                 'requirements': requirements,
-                'coordinator_id': self.coordinator_id
+                'coordinator_id': self.coordinator_id,
+                'gossip_id': gossip_id,
+                'ttl': self.gossip_ttl,
+                'card': self._capability_card()
             }
         )
         
-        # Broadcast to peer coordinators
-        for peer_id in self.peer_coordinators:
-            await self.message_bus.send_message(peer_id, message)
+        # Fan out to a few peers; they forward until the TTL runs out
+        targets = await self._gossip(message)
         
-        self.logger.info(f"Requested {resource_type} assistance from peers")
+        self.logger.info(f"Requested {resource_type} assistance from {len(targets)} peers")
+        return bool(targets)
+    
+    def add_peer(self, peer_id: str) -> None:
+        """Register a peer coordinator and admit it to the view if there is room"""
+        if peer_id == self.coordinator_id:
+            return
+        self.peer_coordinators.add(peer_id)
+        if peer_id not in self._view and len(self._view) < self.view_size:
+            self._view.append(peer_id)
+    
+    async def _gossip(self, message: Message, exclude: Optional[Set[str]] = None) -> List[str]:
+        """Send a message to up to gossip_fanout random peers from the view"""
+        if not self._view:
+            self._refresh_view()
+        
+        candidates = [peer_id for peer_id in self._view if not exclude or peer_id not in exclude]
+        targets = random.sample(candidates, min(self.gossip_fanout, len(candidates)))
+        
+        await asyncio.gather(*(self.message_bus.send_message(peer_id, message) for peer_id in targets))
+        return targets
+    
+    def _mark_gossip_seen(self, gossip_id: str) -> bool:
+        """Record a gossip id; returns False if it was already seen"""
+        if gossip_id in self._seen_gossip:
+            return False
+        self._seen_gossip[gossip_id] = None
+        if len(self._seen_gossip) > self._max_seen_gossip:
+            self._seen_gossip.popitem(last=False)
         return True
     
+    def _capability_card(self) -> Dict[str, Any]:
+        """Summary of spare capacity piggybacked on gossip messages"""
+        return {
+            'coordinator_id': self.coordinator_id,
+            'idle_workers': self.metrics.idle_workers,
+            'current_load': self.metrics.current_load,
+            'resources': list(self.shared_resources.keys())
+        }
+    
+    def _refresh_view(self) -> None:
+        """Resample the partial view from all known peers"""
+        peers = list(self.peer_coordinators)
+        self._view = random.sample(peers, min(self.view_size, len(peers)))
+    
+    async def _view_shuffle_loop(self) -> None:
+        """Periodically exchange part of the view with a random peer (CYCLON-style)"""
+        while self.running:
+            try:
+                await asyncio.sleep(self.view_shuffle_interval)
+                
+                if not self._view:
+                    self._refresh_view()
+                    continue
+                
+                partner = random.choice(self._view)
+                sample = random.sample(self._view, min(self.view_size // 2, len(self._view)))
+                sample = [peer_id for peer_id in sample if peer_id != partner] + [self.coordinator_id]
+                
+                # Swap the shipped entries out so the view keeps turning over
+                self._view = [peer_id for peer_id in self._view if peer_id not in sample]
+                
+                message = Message(
+                    message_type=MessageType.PEER_COORDINATION,
+                    sender_id=self.coordinator_id,
+                    data={
+                        'action': 'view_shuffle',
+                        'peers': sample,
+                        'card': self._capability_card()
+                    }
+                )
+                await self.message_bus.send_message(partner, message)
+                
+            except Exception as e:
+                self.logger.error(f"Error in view shuffle: {e}")
+    
     async def offer_peer_assistance(self, peer_id: str, resource_type: str, resources: Dict[str, Any]) -> None:
         """Offer assistance to a peer coordinator"""
         message = Message(
@@ -212,12 +348,15 @@ class SubCoordinator(BaseCoordinator):
             )
             tasks.append(task)
         
+        self._total_created += len(tasks)
         return tasks
     
     async def _task_distribution_loop(self) -> None:
         """Main loop for distributing tasks to workers"""
         while self.running:
             try:
+                self._drain_task_overflow()
+                
                 # Get next task
                 task = await asyncio.wait_for(self.task_queue.get(), timeout=1.0)
                 
@@ -229,6 +368,7 @@ class SubCoordinator(BaseCoordinator):
                     task.assigned_worker_id = available_worker.worker_id
                     task.status = TaskStatus.IN_PROGRESS
                     task.start_time = datetime.now()
+                    self._task_started_at[task.task_id] = time.monotonic()
                     
                     self.active_tasks[task.task_id] = task
                     
@@ -238,7 +378,7 @@ class SubCoordinator(BaseCoordinator):
                     self.logger.debug(f"Assigned task {task.task_id} to worker {available_worker.worker_id}")
                 else:
                     # Put task back in queue
-                    await self.task_queue.put(task)
+                    self._requeue_task(task)
                     await asyncio.sleep(1)  # Wait before retrying
                     
             except asyncio.TimeoutError:
@@ -251,9 +391,7 @@ class SubCoordinator(BaseCoordinator):
         while self.running:
             try:
                 await asyncio.sleep(self.report_interval)
-                
-                if datetime.now().timestamp() - self.last_report_time.timestamp() >= self.report_interval:
-                    await self._send_status_report()
+                await self._send_status_report()
                     
             except Exception as e:
                 self.logger.error(f"Error in status reporting: {e}")
@@ -262,9 +400,11 @@ class SubCoordinator(BaseCoordinator):
         """Monitor worker health and system performance"""
         while self.running:
             try:
-                # Check worker health
-                for worker_id, worker in list(self.workers.items()):
-                    if not await worker.is_healthy():
+                # Check worker health, probing all workers concurrently
+                workers = list(self.workers.items())
+                health = await asyncio.gather(*(worker.is_healthy() for _, worker in workers))
+                for (worker_id, _), healthy in zip(workers, health):
+                    if not healthy:
                         self.logger.warning(f"Worker {worker_id} is unhealthy, removing")
                         await self.remove_worker(worker_id)
                 
@@ -274,25 +414,69 @@ class SubCoordinator(BaseCoordinator):
                 # Check for completed tasks
                 await self._process_completed_tasks()
                 
+                # Persist evicted history on a timer even when batches are small
+                if (datetime.now() - self._last_archive_flush).total_seconds() >= self.archive_flush_interval:
+                    await self._flush_archive()
+                
                 await asyncio.sleep(10)  # Check every 10 seconds
                 
             except Exception as e:
                 self.logger.error(f"Error in health monitoring: {e}")
     
     async def _message_processing_loop(self) -> None:
-        """Process incoming messages"""
+        """Process incoming messages in batches"""
         while self.running:
             try:
-                messages = await self.message_bus.receive_messages(self.coordinator_id)
+                messages = await self._receive_message_batch()
                 
-                for message in messages:
-                    await self._handle_message(message)
+                if not messages:
+                    # Only idle polling pays the delay; bursts are drained back to back
+                    await asyncio.sleep(0.1)
+                    continue
                 
-                await asyncio.sleep(0.1)  # Small delay to prevent busy waiting
+                await self._dispatch_message_batch(messages)
                 
             except Exception as e:
                 self.logger.error(f"Error processing messages: {e}")
     
+    async def _receive_message_batch(self) -> List[Message]:
+        """Receive pending messages, blocking on the bus when it supports it"""
+        receive_blocking = getattr(self.message_bus, 'receive_messages_blocking', None)
+        if receive_blocking:
+            return await receive_blocking(self.coordinator_id, timeout=1.0)
+        return await self.message_bus.receive_messages(self.coordinator_id)
+    
+    async def _dispatch_message_batch(self, messages: List[Message]) -> None:
+        """Group messages by type and handle each group concurrently"""
+        batches: Dict[MessageType, List[Message]] = {}
+        for message in messages:
+            batches.setdefault(message.message_type, []).append(message)
+        
+        results = await asyncio.gather(
+            *(self._handle_message_group(group) for group in batches.values()),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                self.logger.error(f"Error handling message batch: {result}")
+    
+    async def _handle_message_group(self, messages: List[Message]) -> None:
+        """Handle same-type messages in arrival order"""
+        for message in messages:
+            await self._handle_message(message)
+    
+    def _requeue_task(self, task: Task) -> None:
+        """Return a task to the queue without blocking, spilling to overflow when full"""
+        try:
+            self.task_queue.put_nowait(task)
+        except asyncio.QueueFull:
+            self._task_overflow.append(task)
+    
+    def _drain_task_overflow(self) -> None:
+        """Move overflowed tasks back into the queue as space frees up"""
+        while self._task_overflow and not self.task_queue.full():
+            self.task_queue.put_nowait(self._task_overflow.popleft())
+    
     def _find_available_worker(self, task: Task) -> Optional[Worker]:
         """Find an available worker for the task"""
         for worker in self.workers.values():
@@ -311,7 +495,7 @@ class SubCoordinator(BaseCoordinator):
                 task.status = TaskStatus.COMPLETED
                 task.end_time = datetime.now()
                 completed.append(task_id)
-                self.completed_tasks.append(task)
+                await self._record_completion(task)
                 
                 self.logger.debug(f"Task {task_id} completed by worker {worker.worker_id}")
         
@@ -319,17 +503,71 @@ class SubCoordinator(BaseCoordinator):
         for task_id in completed:
             del self.active_tasks[task_id]
     
+    async def _record_completion(self, task: Task) -> None:
+        """Add a finished task to the history and running metric totals"""
+        if len(self.completed_tasks) == self.completed_tasks.maxlen:
+            # Oldest entry is about to be evicted from the bounded history
+            await self._archive_task(self.completed_tasks[0])
+        
+        self.completed_tasks.append(task)
+        self._completion_count += 1
+        
+        if task.status == TaskStatus.COMPLETED:
+            self._success_count += 1
+        
+        started_at = self._task_started_at.pop(task.task_id, None)
+        if started_at is not None:
+            self._completion_time_sum += time.monotonic() - started_at
+            self._completion_time_count += 1
+    
+    async def _archive_task(self, task: Task) -> None:
+        """Queue a completed task for the append-only archive log"""
+        if not self.archive_path:
+            return
+        
+        self._archive_buffer.append({
+            'task_id': task.task_id,
+            'sub_project_id': task.sub_project_id,
+            'status': task.status.value,
+            'assigned_worker_id': task.assigned_worker_id,
+            'start_time': task.start_time.isoformat() if task.start_time else None,
+            'end_time': task.end_time.isoformat() if task.end_time else None
+        })
+        
+        if len(self._archive_buffer) >= self.archive_batch_size:
+            await self._flush_archive()
+    
+    async def _flush_archive(self) -> None:
+        """Write buffered archive entries to disk in a single batch"""
+        self._last_archive_flush = datetime.now()
+        if not self._archive_buffer:
+            return
+        
+        batch, self._archive_buffer = self._archive_buffer, []
+        lines = ''.join(json.dumps(entry) + '\n' for entry in batch)
+        
+        try:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(self.executor, self._append_archive, lines)
+        except Exception as e:
+            self.logger.error(f"Error archiving completed tasks: {e}")
+    
+    def _append_archive(self, lines: str) -> None:
+        """Append serialized entries to the archive log (runs in executor)"""
+        with open(self.archive_path, 'a') as f:
+            f.write(lines)
+    
     async def _send_status_report(self) -> None:
         """Send status report to main coordinator"""
-        total_tasks = len(self.completed_tasks) + len(self.active_tasks) + self.task_queue.qsize()
-        progress = len(self.completed_tasks) / max(total_tasks, 1) * 100
+        total_tasks = self._total_created
+        progress = self._completion_count / max(total_tasks, 1) * 100
         
         report = StatusReport(
             coordinator_id=self.coordinator_id,
             timestamp=datetime.now(),
             sub_project_id=self.sub_project.project_id,
             progress_percentage=progress,
-            completed_tasks=len(self.completed_tasks),
+            completed_tasks=self._completion_count,
             total_tasks=total_tasks,
             active_tasks=len(self.active_tasks),
             team_metrics=self.metrics
@@ -338,7 +576,7 @@ class SubCoordinator(BaseCoordinator):
         message = Message(
             message_type=MessageType.STATUS_REPORT,
             sender_id=self.coordinator_id,
-            data=report.__dict__
+            data=asdict(report)
         )
         
         await self.message_bus.send_message("main_coordinator", message)
@@ -352,16 +590,12 @@ class SubCoordinator(BaseCoordinator):
         self.metrics.active_workers = sum(1 for w in self.workers.values() if w.status == WorkerStatus.BUSY)
         self.metrics.idle_workers = sum(1 for w in self.workers.values() if w.status == WorkerStatus.IDLE)
         
-        if self.completed_tasks:
-            completion_times = [
-                (task.end_time - task.start_time).total_seconds() 
-                for task in self.completed_tasks 
-                if task.end_time and task.start_time
-            ]
-            self.metrics.avg_task_completion_time = sum(completion_times) / len(completion_times) if completion_times else 0
-            
-            successful_tasks = sum(1 for task in self.completed_tasks if task.status == TaskStatus.COMPLETED)
-            self.metrics.success_rate = successful_tasks / len(self.completed_tasks)
+        if self._completion_count:
+            self.metrics.avg_task_completion_time = (
+                self._completion_time_sum / self._completion_time_count
+                if self._completion_time_count else 0
+            )
+            self.metrics.success_rate = self._success_count / self._completion_count
         
         # Calculate current load
         if self.workers:
@@ -369,27 +603,41 @@ class SubCoordinator(BaseCoordinator):
     
     async def _handle_message(self, message: Message) -> None:
         """Handle incoming messages"""
-        if message.message_type == MessageType.RESOURCE_REQUEST:
-            await self._handle_resource_request(message)
-        elif message.message_type == MessageType.RESOURCE_OFFER:
-            await self._handle_resource_offer(message)
-        elif message.message_type == MessageType.TASK_ASSIGNMENT:
-            await self._handle_task_assignment(message)
-        elif message.message_type == MessageType.PEER_COORDINATION:
-            await self._handle_peer_coordination(message)
+        handler = self._handlers.get(message.message_type)
+        if handler:
+            await handler(message)
     
     async def _handle_resource_request(self, message: Message) -> None:
-        """Handle resource requests from peers"""
+        """Handle resource requests gossiped from peers"""
+        gossip_id = message.data.get('gossip_id')
+        if gossip_id and not self._mark_gossip_seen(gossip_id):
+            return
+        
+        origin_id = message.data.get('coordinator_id', message.sender_id)
+        card = message.data.get('card')
+        if card:
+            self.peer_cards[origin_id] = card
+        
         # Check if we can help
         resource_type = message.data.get('resource_type')
         requirements = message.data.get('requirements', {})
         
         if self._can_provide_resource(resource_type, requirements):
             await self.offer_peer_assistance(
-                message.sender_id,
+                origin_id,
                 resource_type,
                 self._get_available_resources(resource_type)
             )
+        
+        # Forward unseen requests until the hop budget is spent
+        ttl = message.data.get('ttl', 0) - 1
+        if gossip_id and ttl > 0:
+            forward = Message(
+                message_type=MessageType.RESOURCE_REQUEST,
+                sender_id=self.coordinator_id,
+                data={**message.data, 'ttl': ttl}
+            )
+            await self._gossip(forward, exclude={message.sender_id, origin_id})
     
     async def _handle_resource_offer(self, message: Message) -> None:
         """Handle resource offers from peers"""
@@ -399,4 +647,38 @@ class SubCoordinator(BaseCoordinator):
         
         # Implementation depends on specific resource needs
         self.logger.info(f"Received resource offer from {message.sender_id}: {resource_type}")
-    
\ No newline at end of file
+    
+    async def _handle_peer_coordination(self, message: Message) -> None:
+        """Handle view shuffles and other peer coordination messages"""
+        card = message.data.get('card')
+        if card:
+            self.peer_cards[message.sender_id] = card
+        
+        if message.data.get('action') != 'view_shuffle':
+            return
+        
+        received = [peer_id for peer_id in message.data.get('peers', []) if peer_id != self.coordinator_id]
+        for peer_id in received:
+            self.peer_coordinators.add(peer_id)
+        
+        # Reply with part of our view so the exchange is symmetric
+        if not message.data.get('reply'):
+            sample = random.sample(self._view, min(len(received), len(self._view)))
+            reply = Message(
+                message_type=MessageType.PEER_COORDINATION,
+                sender_id=self.coordinator_id,
+                data={
+                    'action': 'view_shuffle',
+                    'reply': True,
+                    'peers': sample,
+                    'card': self._capability_card()
+                }
+            )
+            await self.message_bus.send_message(message.sender_id, reply)
+        
+        # Merge received entries, keeping the view bounded
+        for peer_id in received:
+            if peer_id not in self._view:
+                self._view.append(peer_id)
+        if len(self._view) > self.view_size:
+            self._view = random.sample(self._view, self.view_size)
@@ -1,101 +1,186 @@
 import asyncio
 from collections import defaultdict
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import logging
 
 from .models import ProgressReport, AggregatedProgress, NodeType, Status
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Fan-out width at which child math switches to NumPy arrays
+VECTORIZE_THRESHOLD = 32
+
+_STATUS_CODES = {Status.COMPLETED: 1, Status.FAILED: 2, Status.BLOCKED: 3}
+
+
+class _ChildArrays:
+    """Parallel arrays over a parent's children, aligned with hierarchy order"""
+
+    def __init__(self, pairs: List[Tuple[str, float]], reports: Dict[str, ProgressReport]):
+        count = len(pairs)
+        self.child_ids = [child_id for child_id, _ in pairs]
+        self.slots: Dict[str, List[int]] = defaultdict(list)
+        self.weights = np.fromiter((weight for _, weight in pairs), dtype=float, count=count)
+        self.progress = np.zeros(count)
+        self.present = np.zeros(count, dtype=bool)
+        self.status = np.zeros(count, dtype=np.int8)
+        self.stalled = np.zeros(count, dtype=bool)
+
+        for index, child_id in enumerate(self.child_ids):
+            self.slots[child_id].append(index)
+            report = reports.get(child_id)
+            if report:
+                self._write(index, report)
+
+    def update(self, report: ProgressReport):
+        """Write a child's latest report into its slot(s)"""
+        for index in self.slots.get(report.node_id, ()):
+            self._write(index, report)
+
+    def _write(self, index: int, report: ProgressReport):
+        self.progress[index] = report.progress_percentage
+        self.present[index] = True
+        self.status[index] = _STATUS_CODES.get(report.status, 0)
+        self.stalled[index] = bool(report.throughput and report.throughput < 0.1)
+
 class ProgressAggregator:
     def __init__(self, bottleneck_threshold: float = 0.1):
         self.progress_reports: Dict[str, ProgressReport] = {}
         self.hierarchy: Dict[str, List[str]] = defaultdict(list)  # parent -> children
         self.parent_map: Dict[str, str] = {}  # child -> parent
         self.weights: Dict[str, float] = defaultdict(lambda: 1.0)
+        # Per-parent (child, weight) pairs and weight totals, maintained on registration
+        self._child_weights: Dict[str, List[Tuple[str, float]]] = defaultdict(list)
+        self._total_weight: Dict[str, float] = defaultdict(float)
+        self._child_arrays: Dict[str, _ChildArrays] = {}
+        # Output versions let consumers detect change with one int comparison
+        self._versions: Dict[str, int] = defaultdict(int)
+        self._signatures: Dict[str, tuple] = {}
         self.bottleneck_threshold = bottleneck_threshold
-        self._lock = asyncio.Lock()
+        # No lock: state is only touched from the event loop, and no method
+        # awaits between reading and mutating it
+        # Ancestors awaiting recomputation; flushed once per event-loop pass
+        self._dirty: Set[str] = set()
+        self._flush_task: Optional[asyncio.Task] = None
+        self._latest: Dict[str, AggregatedProgress] = {}
 
     async def register_node(self, node_id: str, parent_id: Optional[str] = None, 
                            weight: float = 1.0):
         """Register a node in the hierarchy"""
-        async with self._lock:
-            if parent_id:
-                self.hierarchy[parent_id].append(node_id)
-                self.parent_map[node_id] = parent_id
-            self.weights[node_id] = weight
+        previous_weight = self.weights.get(node_id)
+        if parent_id:
+            self.hierarchy[parent_id].append(node_id)
+            self.parent_map[node_id] = parent_id
+            self._child_weights[parent_id].append((node_id, weight))
+            self._total_weight[parent_id] += weight
+            self._child_arrays.pop(parent_id, None)
+        self.weights[node_id] = weight
+
+        # Re-registering with a new weight invalidates the parent's cached pairs
+        if previous_weight is not None and previous_weight != weight and node_id in self.parent_map:
+            self._rebuild_child_weights(self.parent_map[node_id])
+
+    def _rebuild_child_weights(self, parent_id: str):
+        """Recompute cached child weights and total for a parent"""
+        pairs = [(child_id, self.weights[child_id]) for child_id in self.hierarchy[parent_id]]
+        self._child_weights[parent_id] = pairs
+        self._total_weight[parent_id] = sum(weight for _, weight in pairs)
+        self._child_arrays.pop(parent_id, None)
+
+    def _store_report(self, report: ProgressReport):
+        """Record a report and mirror it into the parent's arrays if built"""
+        self.progress_reports[report.node_id] = report
+        arrays = self._child_arrays.get(self.parent_map.get(report.node_id))
+        if arrays:
+            arrays.update(report)
 
     async def update_progress(self, report: ProgressReport) -> Optional[AggregatedProgress]:
         """Update progress for a node and propagate up the hierarchy"""
-        async with self._lock:
-            self.progress_reports[report.node_id] = report
-            
-            # If this is a worker node, propagate up
-            if report.node_id in self.parent_map:
-                parent_id = self.parent_map[report.node_id]
-                return await self._aggregate_progress(parent_id)
+        self._store_report(report)
             
+        # If this is a worker node, propagate up
+        parent_id = self.parent_map.get(report.node_id)
+        if parent_id is None:
             return None
 
-    async def _aggregate_progress(self, node_id: str) -> AggregatedProgress:
-        """Aggregate progress from child nodes"""
+        # Reports arriving in the same loop pass share a single propagation
+        self._mark_dirty(parent_id)
+        if self._flush_task is None:
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush_aggregations())
+        flush_task = self._flush_task
+
+        await asyncio.shield(flush_task)
+        return self._latest.get(parent_id)
+
+    def _mark_dirty(self, node_id: str):
+        """Mark a node and all of its ancestors for recomputation"""
+        while node_id is not None and node_id not in self._dirty:
+            self._dirty.add(node_id)
+            node_id = self.parent_map.get(node_id)
+
+    def _depth(self, node_id: str) -> int:
+        """Distance from a node to the root of its hierarchy"""
+        depth = 0
+        while node_id in self.parent_map:
+            node_id = self.parent_map[node_id]
+            depth += 1
+        return depth
+
+    async def _flush_aggregations(self):
+        """Recompute every dirty node once, children before parents"""
+        self._flush_task = None
+        self._flush_dirty()
+
+    def _flush_dirty(self):
+        dirty, self._dirty = self._dirty, set()
+        for node_id in sorted(dirty, key=self._depth, reverse=True):
+            self._latest[node_id] = self._aggregate_progress(node_id)
+
+    def _aggregate_progress(self, node_id: str) -> AggregatedProgress:
+        """Aggregate progress from child nodes.
+
+        Only this node is computed; callers order parents after children.
+        """
         children = self.hierarchy[node_id]
         if not children:
             # Leaf node, return its own progress
             report = self.progress_reports.get(node_id)
             if report:
-                return AggregatedProgress(
+                return self._stamp_version(AggregatedProgress(
                     node_id=node_id,
                     total_progress=report.progress_percentage,
                     weighted_progress=report.progress_percentage,
                     child_count=0,
                     completed_children=1 if report.status == Status.COMPLETED else 0,
                     failed_children=1 if report.status == Status.FAILED else 0
-                )
-
-        total_weight = sum(self.weights[child] for child in children)
-        weighted_progress = 0.0
-        completed_count = 0
-        failed_count = 0
-        bottlenecks = []
-
-        child_progresses = []
-        
-        for child_id in children:
-            child_report = self.progress_reports.get(child_id)
-            if child_report:
-                child_weight = self.weights[child_id]
-                child_progress = child_report.progress_percentage
-                
-                # Calculate weighted contribution
-                weight_ratio = child_weight / total_weight if total_weight > 0 else 0
-                weighted_progress += child_progress * weight_ratio
-                
-                child_progresses.append((child_id, child_progress, child_report))
-                
-                if child_report.status == Status.COMPLETED:
-                    completed_count += 1
-                elif child_report.status == Status.FAILED:
-                    failed_count += 1
+                ))
 
-        # Detect bottlenecks
-        bottlenecks = self._detect_bottlenecks(child_progresses)
+        if NUMPY_AVAILABLE and len(children) >= VECTORIZE_THRESHOLD:
+            stats = self._aggregate_children_vectorized(node_id)
+        else:
+            stats = self._aggregate_children(node_id)
+        total_progress, weighted_progress, completed_count, failed_count, bottlenecks = stats
         
         aggregated = AggregatedProgress(
             node_id=node_id,
-            total_progress=sum(p[1] for p in child_progresses) / len(child_progresses) if child_progresses else 0,
+            total_progress=total_progress,
             weighted_progress=weighted_progress,
             child_count=len(children),
             completed_children=completed_count,
             failed_children=failed_count,
             bottlenecks=bottlenecks
         )
+        self._stamp_version(aggregated)
 
-        # Propagate further up if this node has a parent
+        # Feed the parent a synthetic report for this aggregated node
         if node_id in self.parent_map:
-            parent_id = self.parent_map[node_id]
-            # Create synthetic report for this aggregated node
             synthetic_report = ProgressReport(
                 node_id=node_id,
                 node_type=NodeType.SUB_COORDINATOR,
@@ -104,11 +189,85 @@ class ProgressAggregator:
                 progress_percentage=weighted_progress,
                 weight=self.weights[node_id]
             )
-            self.progress_reports[node_id] = synthetic_report
-            await self._aggregate_progress(parent_id)
+            self._store_report(synthetic_report)
+
+        return aggregated
 
+    def _stamp_version(self, aggregated: AggregatedProgress) -> AggregatedProgress:
+        """Set the node's output version, bumping it only if the output changed"""
+        node_id = aggregated.node_id
+        signature = (
+            aggregated.total_progress,
+            aggregated.weighted_progress,
+            aggregated.child_count,
+            aggregated.completed_children,
+            aggregated.failed_children,
+            tuple(aggregated.bottlenecks)
+        )
+        if self._signatures.get(node_id) != signature:
+            self._signatures[node_id] = signature
+            self._versions[node_id] += 1
+        aggregated.version = self._versions[node_id]
         return aggregated
 
+    def _aggregate_children(self, node_id: str) -> tuple:
+        """Aggregate child progress with a plain Python loop"""
+        total_weight = self._total_weight[node_id]
+        weighted_sum = 0.0
+        completed_count = 0
+        failed_count = 0
+
+        child_progresses = []
+        
+        for child_id, child_weight in self._child_weights[node_id]:
+            child_report = self.progress_reports.get(child_id)
+            if child_report:
+                child_progress = child_report.progress_percentage
+                weighted_sum += child_progress * child_weight
+                
+                child_progresses.append((child_id, child_progress, child_report))
+                
+                if child_report.status == Status.COMPLETED:
+                    completed_count += 1
+                elif child_report.status == Status.FAILED:
+                    failed_count += 1
+
+        # Normalize once by the cached total instead of per child
+        weighted_progress = weighted_sum / total_weight if total_weight > 0 else 0
+        total_progress = sum(p[1] for p in child_progresses) / len(child_progresses) if child_progresses else 0
+        bottlenecks = self._detect_bottlenecks(child_progresses)
+
+        return total_progress, weighted_progress, completed_count, failed_count, bottlenecks
+
+    def _aggregate_children_vectorized(self, node_id: str) -> tuple:
+        """Aggregate child progress with NumPy reductions for wide fan-out"""
+        arrays = self._child_arrays.get(node_id)
+        if arrays is None:
+            arrays = _ChildArrays(self._child_weights[node_id], self.progress_reports)
+            self._child_arrays[node_id] = arrays
+
+        total_weight = self._total_weight[node_id]
+        present = arrays.present
+        present_count = int(present.sum())
+        if present_count == 0:
+            return 0, 0.0, 0, 0, []
+
+        # Absent children hold zero progress, so they drop out of the weighted sum
+        weighted_sum = float((arrays.progress * arrays.weights).sum())
+        weighted_progress = weighted_sum / total_weight if total_weight > 0 else 0
+        total_progress = float(arrays.progress[present].sum()) / present_count
+        completed_count = int(((arrays.status == 1) & present).sum())
+        failed_count = int(((arrays.status == 2) & present).sum())
+
+        bottlenecks = []
+        if present_count >= 2:
+            behind = present & ((total_progress - arrays.progress) > self.bottleneck_threshold * 100)
+            # Blocked/failed status or very low throughput
+            stuck = (arrays.status >= 2) | arrays.stalled
+            bottlenecks = [arrays.child_ids[i] for i in np.flatnonzero(behind & stuck)]
+
+        return total_progress, weighted_progress, completed_count, failed_count, bottlenecks
+
     def _detect_bottlenecks(self, child_progresses: List[tuple]) -> List[str]:
         """Identify nodes that are significantly behind others"""
         if len(child_progresses) < 2:
@@ -129,14 +288,15 @@ class ProgressAggregator:
 
     async def get_aggregated_progress(self, node_id: str) -> Optional[AggregatedProgress]:
         """Get current aggregated progress for a node"""
-        async with self._lock:
-            return await self._aggregate_progress(node_id)
+        self._flush_dirty()
+        return self._aggregate_progress(node_id)
 
     async def get_hierarchy_status(self) -> Dict[str, AggregatedProgress]:
         """Get status for entire hierarchy"""
-        async with self._lock:
-            result = {}
-            # Get all parent nodes (nodes that have children)
-            for parent_id in self.hierarchy.keys():
-                result[parent_id] = await self._aggregate_progress(parent_id)
-            return result
\ No newline at end of file
+        self._flush_dirty()
+        result = {}
+        # Get all parent nodes (nodes that have children), deepest first so
+        # each parent sees its children's fresh synthetic reports
+        for parent_id in sorted(self.hierarchy.keys(), key=self._depth, reverse=True):
+            result[parent_id] = self._aggregate_progress(parent_id)
+        return result
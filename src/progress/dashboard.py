@@ -1,24 +1,59 @@
 import asyncio
 import json
-from typing import Dict, List, Set, Optional
+from typing import Callable, Dict, List, Set, Optional
 from datetime import datetime
 import logging
-from dataclasses import asdict
 
 from .aggregator import ProgressAggregator
 from .models import AggregatedProgress, Status
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 class ProgressDashboard:
-    def __init__(self, aggregator: ProgressAggregator, update_interval: float = 0.5):
+    def __init__(self, aggregator: ProgressAggregator, update_interval: float = 0.5,
+                 snapshot_every: int = 20):
         self.aggregator = aggregator
         self.update_interval = update_interval
+        self.snapshot_every = snapshot_every
         self.subscribers: Set[Callable] = set()
         self.last_update: Optional[datetime] = None
         self.cached_status: Dict[str, AggregatedProgress] = {}
         self._update_task: Optional[asyncio.Task] = None
         self._shutdown = False
+        # Persistent output dicts, mutated in place each tick instead of rebuilt
+        self._node_cache: Dict[str, dict] = {}
+        self._summary: dict = {
+            "total_nodes": 0,
+            "overall_progress": 0.0,
+            "total_bottlenecks": 0,
+            "total_failed": 0
+        }
+        self._dashboard_data: dict = {
+            "type": "snapshot",
+            "timestamp": None,
+            "nodes": self._node_cache,
+            "summary": self._summary
+        }
+        # Pushes are deltas of changed nodes; full snapshots go out periodically
+        # and whenever a new subscriber needs a baseline
+        self._last_serialized: Optional[bytes] = None
+        self._pushes_since_snapshot = 0
+        self._needs_snapshot = True
+
+    def subscribe(self, callback: Callable):
+        """Register a callback that receives encoded dashboard JSON"""
+        self.subscribers.add(callback)
+        self._needs_snapshot = True
+
+    def unsubscribe(self, callback: Callable):
+        """Remove a previously registered callback"""
+        self.subscribers.discard(callback)
 
     async def start(self):
         """Start real-time dashboard updates"""
@@ -56,78 +91,145 @@ class ProgressDashboard:
             current_status = await self.aggregator.get_hierarchy_status()
             
             # Check if there are meaningful changes
-            if self._has_significant_changes(current_status):
-                self.cached_status = current_status
-                self.last_update = datetime.utcnow()
-                
-                # Notify all subscribers
+            changed, removed = self._find_changes(current_status)
+            if not (changed or removed or self._needs_snapshot):
+                return
+
+            for node_id in changed:
+                self.cached_status[node_id] = current_status[node_id]
+            for node_id in removed:
+                del self.cached_status[node_id]
+            self.last_update = datetime.utcnow()
+
+            self._pushes_since_snapshot += 1
+            if self._needs_snapshot or self._pushes_since_snapshot >= self.snapshot_every:
                 dashboard_data = self._format_dashboard_data(current_status)
-                await self._notify_subscribers(dashboard_data)
+                self._last_serialized = self._encode(dashboard_data)
+                self._needs_snapshot = False
+                self._pushes_since_snapshot = 0
+                payload = self._last_serialized
+            else:
+                payload = self._encode(self._format_dashboard_delta(current_status, changed, removed))
+
+            # Notify all subscribers
+            await self._notify_subscribers(payload)
                 
         except Exception as e:
             logger.error(f"Failed to update dashboard: {e}")
 
-    def _has_significant_changes(self, new_status: Dict[str, AggregatedProgress]) -> bool:
-        """Check if changes are significant enough to warrant an update"""
-        if not self.cached_status:
-            return True
-            
+    def _find_changes(self, new_status: Dict[str, AggregatedProgress]) -> tuple:
+        """Return (changed_or_new_ids, removed_ids) relative to the last push"""
+        changed = []
         for node_id, new_progress in new_status.items():
             old_progress = self.cached_status.get(node_id)
             if not old_progress:
-                return True
+                changed.append(node_id)
+
+            # Same aggregator version means identical output; skip field compares
+            elif new_progress.version and new_progress.version == old_progress.version:
+                continue
                 
             # Check for significant progress changes (>1%)
-            if abs(new_progress.weighted_progress - old_progress.weighted_progress) > 1.0:
-                return True
+            elif abs(new_progress.weighted_progress - old_progress.weighted_progress) > 1.0:
+                changed.append(node_id)
                 
             # Check for status changes
-            if (new_progress.completed_children != old_progress.completed_children or
-                new_progress.failed_children != old_progress.failed_children or
-                new_progress.bottlenecks != old_progress.bottlenecks):
-                return True
-                
-        return False
+            elif (new_progress.completed_children != old_progress.completed_children or
+                  new_progress.failed_children != old_progress.failed_children or
+                  new_progress.bottlenecks != old_progress.bottlenecks):
+                changed.append(node_id)
+
+        removed = [node_id for node_id in self.cached_status if node_id not in new_status]
+        return changed, removed
 
     def _format_dashboard_data(self, status: Dict[str, AggregatedProgress]) -> dict:
         """Format progress data for dashboard display"""
-        dashboard_data = {
+        nodes = self._node_cache
+        # Drop nodes that have left the hierarchy since the last tick
+        for node_id in nodes.keys() - status.keys():
+            del nodes[node_id]
+
+        for node_id, progress in status.items():
+            self._format_node(node_id, progress)
+
+        self._update_summary(status)
+        self._dashboard_data["timestamp"] = datetime.utcnow().isoformat()
+        return self._dashboard_data
+
+    def _format_dashboard_delta(self, status: Dict[str, AggregatedProgress],
+                                changed: List[str], removed: List[str]) -> dict:
+        """Format only the nodes that changed since the last push"""
+        for node_id in removed:
+            self._node_cache.pop(node_id, None)
+
+        changes = {
+            node_id: self._format_node(node_id, status[node_id])
+            for node_id in changed
+        }
+
+        self._update_summary(status)
+        return {
+            "type": "delta",
             "timestamp": datetime.utcnow().isoformat(),
-            "nodes": {},
-            "summary": {
-                "total_nodes": len(status),
-                "overall_progress": 0.0,
-                "total_bottlenecks": 0,
-                "total_failed": 0
-            }
+            "changes": changes,
+            "removed": removed,
+            "summary": self._summary
         }
 
+    def _format_node(self, node_id: str, progress: AggregatedProgress) -> dict:
+        """Refresh the persistent output dict for one node"""
+        node_data = self._node_cache.get(node_id)
+        if node_data is None:
+            node_data = self._node_cache[node_id] = {"node_id": node_id}
+
+        node_data["total_progress"] = round(progress.total_progress, 2)
+        node_data["weighted_progress"] = round(progress.weighted_progress, 2)
+        node_data["child_count"] = progress.child_count
+        node_data["completed_children"] = progress.completed_children
+        node_data["failed_children"] = progress.failed_children
+        node_data["bottlenecks"] = progress.bottlenecks
+        node_data["status"] = self._determine_node_status(progress)
+        node_data["timestamp"] = progress.timestamp.isoformat()
+        return node_data
+
+    def _update_summary(self, status: Dict[str, AggregatedProgress]):
+        """Recompute overall metrics in the persistent summary dict"""
         total_progress = 0.0
         total_bottlenecks = 0
         total_failed = 0
-
-        for node_id, progress in status.items():
-            node_data = {
-                "node_id": node_id,
-                "total_progress": round(progress.total_progress, 2),
-                "weighted_progress": round(progress.weighted_progress, 2),
-                "child_count": progress.child_count,
-                "completed_children": progress.completed_children,
-                "failed_children": progress.failed_children,
-                "bottlenecks": progress.bottlenecks,
-                "status": self._determine_node_status(progress),
-                "timestamp": progress.timestamp.isoformat()
-            }
-            
-            dashboard_data["nodes"][node_id] = node_data
+        for progress in status.values():
             total_progress += progress.weighted_progress
             total_bottlenecks += len(progress.bottlenecks)
             total_failed += progress.failed_children
 
-        # Calculate overall metrics
-        if status:
-            dashboard_data["summary"]["overall_progress"] = round(
-                total_progress / len(status), 2
-            )
-        dashboard_data["summary"]["total_bottlenecks"] = total_bottlenecks
-        dashboard_
\ No newline at end of file
+        summary = self._summary
+        summary["total_nodes"] = len(status)
+        summary["overall_progress"] = round(total_progress / len(status), 2) if status else 0.0
+        summary["total_bottlenecks"] = total_bottlenecks
+        summary["total_failed"] = total_failed
+
+    def _determine_node_status(self, progress: AggregatedProgress) -> str:
+        """Collapse aggregated counts into a single display status"""
+        if progress.child_count and progress.completed_children == progress.child_count:
+            return Status.COMPLETED.value
+        if progress.failed_children:
+            return Status.FAILED.value
+        if progress.bottlenecks:
+            return Status.BLOCKED.value
+        return Status.RUNNING.value
+
+    def _encode(self, dashboard_data: dict) -> bytes:
+        """Serialize dashboard data once for all subscribers"""
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(dashboard_data)
+        return json.dumps(dashboard_data).encode()
+
+    async def _notify_subscribers(self, payload: bytes):
+        """Push encoded dashboard data to every subscriber"""
+        for callback in list(self.subscribers):
+            try:
+                result = callback(payload)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(f"Dashboard subscriber failed: {e}")
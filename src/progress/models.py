@@ -1,7 +1,10 @@
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import List, Mapping, Optional, Any
 from datetime import datetime
 from enum import Enum
+import time
+
+from ..compat import SLOTS
 
 class NodeType(Enum):
     WORKER = "worker"
@@ -15,7 +18,8 @@ class Status(Enum):
     FAILED = "failed"
     BLOCKED = "blocked"
 
-@dataclass
+# Reports are immutable once sent, so one instance can be shared by every reader
+@dataclass(frozen=True, **SLOTS)
 class ProgressReport:
     node_id: str
     node_type: NodeType
@@ -23,11 +27,12 @@ class ProgressReport:
     progress_percentage: float
     weight: float = 1.0
     timestamp: datetime = field(default_factory=datetime.utcnow)
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    metadata: Mapping[str, Any] = field(default_factory=dict)
     estimated_completion: Optional[datetime] = None
     throughput: Optional[float] = None  # units per second
+    monotonic_ts: float = field(default_factory=time.monotonic)  # for intervals; immune to clock steps
 
-@dataclass  
+@dataclass(**SLOTS)
 class AggregatedProgress:
     node_id: str
     total_progress: float
@@ -36,4 +41,6 @@ class AggregatedProgress:
     completed_children: int
     failed_children: int
     bottlenecks: List[str] = field(default_factory=list)
-    timestamp: datetime = field(default_factory=datetime.utcnow)
\ No newline at end of file
+    timestamp: datetime = field(default_factory=datetime.utcnow)
+    monotonic_ts: float = field(default_factory=time.monotonic)  # for intervals; immune to clock steps
+    version: int = 0  # bumped by the aggregator only when the output changes
@@ -1,14 +1,71 @@
 import asyncio
-from typing import Callable, Optional
+import time
+import weakref
+from types import MappingProxyType
+from typing import Optional
 import logging
-from datetime import datetime
 
 from .models import ProgressReport, NodeType, Status
 from .aggregator import ProgressAggregator
 
 logger = logging.getLogger(__name__)
 
+class _ReportScheduler:
+    """One long-lived task that drives periodic sends for every active reporter"""
+
+    def __init__(self):
+        self.reporters: "weakref.WeakSet[ProgressReporter]" = weakref.WeakSet()
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def register(self, reporter: "ProgressReporter"):
+        self.reporters.add(reporter)
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run())
+        self._wakeup.set()
+
+    def unregister(self, reporter: "ProgressReporter"):
+        self.reporters.discard(reporter)
+
+    def request_send(self, reporter: "ProgressReporter"):
+        """Make a registered reporter due now, coalescing with the next pass"""
+        reporter._next_due = time.monotonic()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _run(self):
+        # Exits once no reporters remain; the next register starts a fresh task
+        while self.reporters:
+            now = time.monotonic()
+            due = [r for r in list(self.reporters) if now >= r._next_due]
+            for reporter in due:
+                reporter._next_due = now + reporter.report_interval
+
+            # Send together so the aggregator coalesces them into one propagation
+            results = await asyncio.gather(
+                *(r._send_progress_report() for r in due if r._dirty),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    logger.error(f"Error in progress reporting: {result}")
+
+            next_due = min((r._next_due for r in self.reporters), default=None)
+            if next_due is None:
+                break
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, next_due - time.monotonic()))
+            except asyncio.TimeoutError:
+                pass
+
+_scheduler = _ReportScheduler()
+
 class ProgressReporter:
+    # Reporter state is owned by a single event loop and is not thread-safe;
+    # other threads should go through asyncio.run_coroutine_threadsafe
     def __init__(self, node_id: str, node_type: NodeType, 
                  aggregator: ProgressAggregator,
                  report_interval: float = 1.0):
@@ -18,39 +75,31 @@ class ProgressReporter:
         self.report_interval = report_interval
         self.current_status = Status.PENDING
         self.current_progress = 0.0
+        # Copy-on-write: rebound on change, never mutated, so reports can share
+        # a read-only view of it instead of a copy
         self.metadata = {}
-        self._reporting_task: Optional[asyncio.Task] = None
-        self._shutdown = False
+        self._metadata_view = MappingProxyType(self.metadata)
+        # Updates between sends are coalesced; the scheduler only sends when dirty
+        self._active = False
+        self._dirty = True
+        self._last_sent = 0.0
+        self._next_due = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     async def start_reporting(self):
         """Start periodic progress reporting"""
-        if self._reporting_task and not self._reporting_task.done():
+        if self._active:
             return
             
-        self._shutdown = False
-        self._reporting_task = asyncio.create_task(self._report_loop())
+        self._check_loop()
+        self._active = True
+        self._next_due = time.monotonic()
+        _scheduler.register(self)
 
     async def stop_reporting(self):
         """Stop progress reporting"""
-        self._shutdown = True
-        if self._reporting_task:
-            self._reporting_task.cancel()
-            try:
-                await self._reporting_task
-            except asyncio.CancelledError:
-                pass
-
-    async def _report_loop(self):
-        """Main reporting loop"""
-        while not self._shutdown:
-            try:
-                await self._send_progress_report()
-                await asyncio.sleep(self.report_interval)
-            except asyncio.CancelledError:
-                break
-            except Exception as e:
-                logger.error(f"Error in progress reporting for {self.node_id}: {e}")
-                await asyncio.sleep(self.report_interval)
+        self._active = False
+        _scheduler.unregister(self)
 
     async def _send_progress_report(self):
         """Send current progress report"""
@@ -59,25 +108,46 @@ class ProgressReporter:
             node_type=self.node_type,
             status=self.current_status,
             progress_percentage=self.current_progress,
-            metadata=self.metadata.copy(),
-            timestamp=datetime.utcnow()
+            metadata=self._metadata_view
         )
+        self._dirty = False
+        self._last_sent = time.monotonic()
         
         await self.aggregator.update_progress(report)
 
     async def update_progress(self, progress: float, status: Optional[Status] = None,
                             metadata: Optional[dict] = None):
         """Update current progress"""
+        self._check_loop()
         self.current_progress = max(0.0, min(100.0, progress))
         
+        status_changed = status is not None and status != self.current_status
         if status:
             self.current_status = status
             
         if metadata:
-            self.metadata.update(metadata)
+            self.metadata = {**self.metadata, **metadata}
+            self._metadata_view = MappingProxyType(self.metadata)
+        
+        self._dirty = True
             
-        # Send immediate update for significant changes
-        await self._send_progress_report()
+        # Send immediately on status transitions or when no scheduler drives
+        # this reporter; otherwise pull the scheduler's next pass forward if
+        # the last send is more than half an interval old
+        if status_changed or not self._active:
+            await self._send_progress_report()
+        elif time.monotonic() - self._last_sent > self.report_interval / 2:
+            _scheduler.request_send(self)
+
+    def _check_loop(self):
+        """Bind to the first event loop used; in asyncio debug mode, reject others"""
+        loop = asyncio.get_running_loop()
+        if self._loop is None or self._loop.is_closed():
+            self._loop = loop
+        elif loop is not self._loop and loop.get_debug():
+            raise RuntimeError(
+                f"ProgressReporter {self.node_id} used from a different event loop"
+            )
 
     async def mark_completed(self, metadata: Optional[dict] = None):
         """Mark task as completed"""
@@ -6,11 +6,21 @@ from .widgets import Spinner, live_display, worker_display
 from .progress import progress_tracker
 
 class ConsoleManager:
+    LEVEL_COLORS = {
+        "info": "\033[94m",     # Blue
+        "success": "\033[92m",  # Green
+        "warning": "\033[93m",  # Yellow
+        "error": "\033[91m",    # Red
+    }
+    
     def __init__(self):
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
         self._active_spinners = {}
         self._console_height = 0
         self._last_output_lines = 0
+        # Formatted timestamp, reused for every message within the same second
+        self._timestamp_second = -1
+        self._timestamp = ""
     
     @contextmanager
     def spinner(self, message: str = "Processing..."):
@@ -47,18 +57,14 @@ class ConsoleManager:
     
     def print_status(self, message: str, level: str = "info"):
         """Print status message with appropriate formatting"""
-        colors = {
-            "info": "\033[94m",     # Blue
-            "success": "\033[92m",  # Green
-            "warning": "\033[93m",  # Yellow
-            "error": "\033[91m",    # Red
-        }
-        
-        color = colors.get(level, "\033[0m")
-        timestamp = time.strftime("%H:%M:%S")
+        color = self.LEVEL_COLORS.get(level, "\033[0m")
+        now = int(time.time())
         
         with self._lock:
-            print(f"{color}[{timestamp}] {message}\033[0m")
+            if now != self._timestamp_second:
+                self._timestamp_second = now
+                self._timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            sys.stdout.write(f"{color}[{self._timestamp}] {message}\033[0m\n")
     
     def clear_screen(self):
         print("\033[2J\033[H", end="")
@@ -1,3 +1,4 @@
+import logging
 import time
 import threading
 from typing import Optional, Callable, Dict, Any
@@ -5,6 +6,11 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 import math
 
+logger = logging.getLogger(__name__)
+
+# Weight of the newest rate sample in the smoothed rate
+RATE_SMOOTHING = 0.2
+
 @dataclass
 class ProgressState:
     current: int = 0
@@ -12,6 +18,13 @@ class ProgressState:
     start_time: float = field(default_factory=time.time)
     description: str = ""
     status: str = "running"  # running, completed, error, paused
+    # Smoothed rate and ETA, refreshed on each update so reads are plain field access
+    rate: float = field(default=0.0, init=False)
+    eta: Optional[float] = field(default=None, init=False)
+    _last_update_ts: float = field(default=0.0, init=False, repr=False)
+    
+    def __post_init__(self):
+        self._last_update_ts = self.start_time
     
     @property
     def percentage(self) -> float:
@@ -21,13 +34,23 @@ class ProgressState:
     def elapsed_time(self) -> float:
         return time.time() - self.start_time
     
-    @property
-    def eta(self) -> Optional[float]:
-        if self.current == 0:
-            return None
-        rate = self.current / self.elapsed_time
+    def advance(self, current: int, now: Optional[float] = None):
+        """Move to a new position and fold the step into the EWMA rate and ETA"""
+        now = time.time() if now is None else now
+        step = current - self.current
+        dt = now - self._last_update_ts
+        self.current = current
+        self._last_update_ts = now
+        
+        if step > 0 and dt > 0:
+            sample = step / dt
+            self.rate = sample if self.rate == 0 else RATE_SMOOTHING * sample + (1 - RATE_SMOOTHING) * self.rate
+        
         remaining = self.total - self.current
-        return remaining / rate if rate > 0 else None
+        if remaining <= 0:
+            self.eta = 0.0
+        elif self.rate > 0:
+            self.eta = remaining / self.rate
     
     @property
     def eta_formatted(self) -> str:
@@ -40,7 +63,7 @@ class ProgressTracker:
     def __init__(self):
         self._states: Dict[str, ProgressState] = {}
         self._callbacks: Dict[str, list] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
     
     def create_progress(self, task_id: str, total: int, description: str = "") -> ProgressState:
         with self._lock:
@@ -51,67 +74,76 @@ class ProgressTracker:
     
     def update_progress(self, task_id: str, current: int, description: str = None):
         with self._lock:
-            if task_id not in self._states:
+            state = self._states.get(task_id)
+            if state is None:
                 return
-            
-            state = self._states[task_id]
-            state.current = min(current, state.total)
-            
-            if description:
-                state.description = description
-            
-            if state.current >= state.total:
-                state.status = "completed"
-            
-            # Notify callbacks
-            for callback in self._callbacks.get(task_id, []):
-                try:
-                    callback(state)
-                except Exception:
-                    pass
+            self._apply_update(state, current, description)
+            callbacks = self._callbacks.get(task_id)
+        
+        if callbacks:
+            self._notify_callbacks(state, callbacks)
     
     def increment_progress(self, task_id: str, amount: int = 1, description: str = None):
         with self._lock:
-            if task_id not in self._states:
+            state = self._states.get(task_id)
+            if state is None:
                 return
-            state = self._states[task_id]
-            self.update_progress(task_id, state.current + amount, description)
+            self._apply_update(state, state.current + amount, description)
+            callbacks = self._callbacks.get(task_id)
+        
+        if callbacks:
+            self._notify_callbacks(state, callbacks)
+    
+    def _apply_update(self, state: ProgressState, current: int, description: str = None):
+        # Caller holds self._lock (a plain Lock, so this must not re-acquire it)
+        state.advance(min(current, state.total))
+        
+        if description:
+            state.description = description
+        
+        if state.current >= state.total:
+            state.status = "completed"
     
     def get_progress(self, task_id: str) -> Optional[ProgressState]:
         return self._states.get(task_id)
     
     def complete_progress(self, task_id: str):
         with self._lock:
-            if task_id in self._states:
-                state = self._states[task_id]
-                state.current = state.total
-                state.status = "completed"
-                self._notify_callbacks(task_id)
+            if task_id not in self._states:
+                return
+            state = self._states[task_id]
+            state.advance(state.total)
+            state.status = "completed"
+            callbacks = self._callbacks.get(task_id)
+        
+        if callbacks:
+            self._notify_callbacks(state, callbacks)
     
     def error_progress(self, task_id: str, error_msg: str = ""):
         with self._lock:
-            if task_id in self._states:
-                state = self._states[task_id]
-                state.status = "error"
-                state.description = error_msg or state.description
-                self._notify_callbacks(task_id)
+            if task_id not in self._states:
+                return
+            state = self._states[task_id]
+            state.status = "error"
+            state.description = error_msg or state.description
+            callbacks = self._callbacks.get(task_id)
+        
+        if callbacks:
+            self._notify_callbacks(state, callbacks)
     
     def add_callback(self, task_id: str, callback: Callable[[ProgressState], None]):
         with self._lock:
-            if task_id not in self._callbacks:
-                self._callbacks[task_id] = []
-            self._callbacks[task_id].append(callback)
+            # Copy-on-write, so notifiers can iterate a list taken under the
+            # lock after releasing it
+            self._callbacks[task_id] = [*self._callbacks.get(task_id, ()), callback]
     
-    def _notify_callbacks(self, task_id: str):
-        state = self._states.get(task_id)
-        if not state:
-            return
-        
-        for callback in self._callbacks.get(task_id, []):
+    def _notify_callbacks(self, state: ProgressState, callbacks: list):
+        # Runs after self._lock is released so slow callbacks never block the tracker
+        for callback in callbacks:
             try:
                 callback(state)
             except Exception:
-                pass
+                logger.exception("Progress callback failed")
     
     def cleanup(self, task_id: str):
         with self._lock:
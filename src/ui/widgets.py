@@ -1,9 +1,24 @@
+import math
+import sys
 import time
 import threading
+from functools import lru_cache
 from typing import Optional
 from .progress import ProgressState, progress_tracker
 
+@lru_cache(maxsize=256)
+def _render_bar(filled_width: int, empty_width: int, fill_char: str, empty_char: str) -> str:
+    """Build a bar body once per distinct fill level, shared by every ProgressBar"""
+    return fill_char * filled_width + empty_char * empty_width
+
 class ProgressBar:
+    STATUS_COLORS = {
+        "running": "\033[94m",    # Blue
+        "completed": "\033[92m",  # Green
+        "error": "\033[91m",      # Red
+        "paused": "\033[93m"      # Yellow
+    }
+    
     def __init__(self, width: int = 50, fill_char: str = "█", empty_char: str = "░"):
         self.width = width
         self.fill_char = fill_char
@@ -12,93 +27,122 @@ class ProgressBar:
     def render(self, progress: ProgressState) -> str:
         percentage = progress.percentage
         filled_width = int(self.width * percentage / 100)
-        empty_width = self.width - filled_width
-        
-        bar = self.fill_char * filled_width + self.empty_char * empty_width
+        bar = _render_bar(filled_width, self.width - filled_width, self.fill_char, self.empty_char)
         
         status_color = self._get_status_color(progress.status)
-        percentage_str = f"{percentage:5.1f}%"
-        eta_str = f"ETA: {progress.eta_formatted}"
-        
-        return f"{status_color}[{bar}] {percentage_str} | {eta_str} | {progress.description}\033[0m"
+        return f"{status_color}[{bar}] {percentage:5.1f}% | ETA: {progress.eta_formatted} | {progress.description}\033[0m"
     
     def _get_status_color(self, status: str) -> str:
-        colors = {
-            "running": "\033[94m",    # Blue
-            "completed": "\033[92m",  # Green
-            "error": "\033[91m",      # Red
-            "paused": "\033[93m"      # Yellow
-        }
-        return colors.get(status, "\033[0m")
+        return self.STATUS_COLORS.get(status, "\033[0m")
+
+def _build_pulse_colors() -> tuple:
+    """Precompute the pulse color escapes for one full intensity cycle"""
+    # Intensity climbs 0.3 -> 1.0 and falls back in 0.1 steps
+    levels = [i / 10 for i in range(3, 11)] + [i / 10 for i in range(9, 3, -1)]
+    colors = []
+    for level in levels:
+        intensity = int(255 * level)
+        colors.append(f"\033[38;2;{intensity};{intensity//2};{intensity//4}m")
+    return tuple(colors)
 
 class Spinner:
-    FRAMES = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"]
+    FRAMES = ("⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏")
+    PULSE_COLORS = _build_pulse_colors()
     
     def __init__(self, message: str = "Loading..."):
         self.message = message
         self.frame_index = 0
+        self.pulse_index = 0
         self.running = False
-        self._thread: Optional[threading.Thread] = None
-        self.pulse_intensity = 0
-        self.pulse_direction = 1
     
     def start(self):
         if self.running:
             return
         
         self.running = True
-        self._thread = threading.Thread(target=self._animate, daemon=True)
-        self._thread.start()
+        _spinner_renderer.add(self)
     
     def stop(self):
         self.running = False
-        if self._thread:
-            self._thread.join(timeout=1)
-        print("\r\033[K", end="")  # Clear current line
+        _spinner_renderer.remove(self)
     
-    def _animate(self):
-        while self.running:
-            # Update pulse effect
-            self.pulse_intensity += self.pulse_direction * 0.1
-            if self.pulse_intensity >= 1:
-                self.pulse_direction = -1
-            elif self.pulse_intensity <= 0.3:
-                self.pulse_direction = 1
-            
-            # Create pulsing effect with color intensity
-            intensity = int(255 * self.pulse_intensity)
-            pulse_color = f"\033[38;2;{intensity};{intensity//2};{intensity//4}m"
-            
-            frame = self.FRAMES[self.frame_index]
-            print(f"\r{pulse_color}{frame} {self.message}\033[0m", end="", flush=True)
-            
-            self.frame_index = (self.frame_index + 1) % len(self.FRAMES)
-            time.sleep(0.1)
+    def next_frame(self) -> str:
+        """Advance the animation one step and return the rendered frame"""
+        color = self.PULSE_COLORS[self.pulse_index]
+        frame = self.FRAMES[self.frame_index]
+        self.pulse_index = (self.pulse_index + 1) % len(self.PULSE_COLORS)
+        self.frame_index = (self.frame_index + 1) % len(self.FRAMES)
+        return f"{color}{frame} {self.message}\033[0m"
+
+class _SpinnerRenderer:
+    """Single background thread that draws every active spinner on one line"""
+    
+    INTERVAL = 0.1
+    
+    def __init__(self):
+        self._spinners = []
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        # Set on remove so the thread can exit without sleeping out the frame
+        self._wake = threading.Event()
+    
+    def add(self, spinner: Spinner):
+        with self._lock:
+            self._spinners.append(spinner)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+    
+    def remove(self, spinner: Spinner):
+        with self._lock:
+            if spinner in self._spinners:
+                self._spinners.remove(spinner)
+            sys.stdout.write("\r\033[K")  # Clear current line
+            sys.stdout.flush()
+        self._wake.set()
+    
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._spinners:
+                    self._thread = None
+                    return
+                line = "  ".join(spinner.next_frame() for spinner in self._spinners)
+                sys.stdout.write(f"\r{line}\033[K")
+                sys.stdout.flush()
+            self._wake.wait(self.INTERVAL)
+            self._wake.clear()
+
+_spinner_renderer = _SpinnerRenderer()
 
 class LiveProgressDisplay:
+    FRAME_INTERVAL = 0.1  # minimum spacing between frames
+    IDLE_INTERVAL = 1.0   # redraw this often with no updates (ETA, finished-task cleanup)
+    
     def __init__(self):
         self.active_tasks = {}
         self.display_thread: Optional[threading.Thread] = None
         self.running = False
         self._lock = threading.RLock()
+        # Set by progress updates so the display redraws only when something changed
+        self._wake = threading.Event()
     
     def add_task(self, task_id: str, description: str = ""):
         with self._lock:
             progress_bar = ProgressBar()
             self.active_tasks[task_id] = {
                 'progress_bar': progress_bar,
-                'last_update': time.time()
+                'last_update': time.monotonic()
             }
             
-            # Add callback to track updates
             progress_tracker.add_callback(task_id, self._on_progress_update)
+            self._wake.set()
             
             if not self.running:
                 self.start_display()
     
     def _on_progress_update(self, state: ProgressState):
-        # This callback is triggered when progress updates
-        pass
+        self._wake.set()
     
     def start_display(self):
         if self.running:
@@ -110,80 +154,102 @@ class LiveProgressDisplay:
     
     def stop_display(self):
         self.running = False
+        self._wake.set()
         if self.display_thread:
             self.display_thread.join(timeout=1)
     
     def _display_loop(self):
         while self.running:
+            self._wake.wait(self.IDLE_INTERVAL)
+            self._wake.clear()
+            if not self.running:
+                break
+            
             with self._lock:
-                # Clear previous lines
                 if self.active_tasks:
-                    print(f"\033[{len(self.active_tasks)}A\033[J", end="")
-                
-                # Display each task
-                for task_id, task_data in list(self.active_tasks.items()):
-                    progress = progress_tracker.get_progress(task_id)
-                    if progress:
-                        progress_bar = task_data['progress_bar']
-                        line = progress_bar.render(progress)
-                        print(line)
-                        
-                        # Remove completed tasks after a delay
-                        if progress.status in ["completed", "error"] and \
-                           time.time() - task_data['last_update'] > 2:
-                            del self.active_tasks[task_id]
-                            progress_tracker.cleanup(task_id)
-                    else:
-                        # Remove tasks without progress state
-                        del self.active_tasks[task_id]
+                    self._render_frame()
             
-            time.sleep(0.1)
+            # Cap the frame rate; updates arriving meanwhile are drawn next frame
+            time.sleep(self.FRAME_INTERVAL)
+    
+    def _render_frame(self):
+        # Caller holds self._lock; the whole frame goes out in one write
+        buf = [f"\033[{len(self.active_tasks)}A\033[J"]  # Clear previous lines
+        finished = []
+        now = time.monotonic()  # read once per frame
+        
+        # Display each task
+        for task_id, task_data in self.active_tasks.items():
+            progress = progress_tracker.get_progress(task_id)
+            if progress:
+                buf.append(task_data['progress_bar'].render(progress))
+                buf.append("\n")
+                
+                # Remove completed tasks after a delay
+                if progress.status in ("completed", "error") and \
+                   now - task_data['last_update'] > 2:
+                    finished.append(task_id)
+                    progress_tracker.cleanup(task_id)
+            else:
+                # Remove tasks without progress state
+                finished.append(task_id)
+        
+        for task_id in finished:
+            del self.active_tasks[task_id]
+        
+        sys.stdout.write("".join(buf))
+        sys.stdout.flush()
 
 # Global display instance
 live_display = LiveProgressDisplay()
 
+PULSE_STEPS = 32  # quantized phases per pulse cycle (power of two for masking)
+
+def _build_pulse_table(base_colors: dict) -> dict:
+    """Precompute one pulse cycle of 24-bit color escapes per status"""
+    table = {}
+    for status, (base_r, base_g, base_b) in base_colors.items():
+        steps = []
+        for step in range(PULSE_STEPS):
+            pulse = (math.sin(2 * math.pi * step / PULSE_STEPS) + 1) / 2  # 0 to 1
+            scale = 0.5 + 0.5 * pulse
+            steps.append(f"\033[38;2;{int(base_r * scale)};{int(base_g * scale)};{int(base_b * scale)}m")
+        table[status] = tuple(steps)
+    return table
+
 class PulsingWorkerIndicator:
+    STATUS_COLORS = {
+        "active": (0, 255, 100),
+        "idle": (100, 100, 100),
+        "busy": (255, 165, 0),
+        "error": (255, 0, 0)
+    }
+    STATUS_ICONS = {
+        "active": "●",
+        "idle": "○",
+        "busy": "◐",
+        "error": "✗"
+    }
+    PULSE_TABLE = _build_pulse_table(STATUS_COLORS)
+    DEFAULT_PULSE = _build_pulse_table({"default": (100, 100, 100)})["default"]
+    
     def __init__(self, worker_id: str, status: str = "active"):
         self.worker_id = worker_id
-        self.status = status
-        self.pulse_phase = 0
-        self.last_update = time.time()
+        self.update_status(status)
     
     def update_status(self, status: str):
         self.status = status
         self.last_update = time.time()
+        # Everything but the color is fixed until the next status change
+        self._pulse = self.PULSE_TABLE.get(status, self.DEFAULT_PULSE)
+        self._label = f"{self.STATUS_ICONS.get(status, '○')} Worker-{self.worker_id} ({status})\033[0m"
     
-    def render(self) -> str:
-        current_time = time.time()
-        self.pulse_phase = (current_time * 2) % (2 * math.pi)  # 2 second cycle
-        
-        # Calculate pulse intensity
-        pulse = (math.sin(self.pulse_phase) + 1) / 2  # 0 to 1
-        
-        status_colors = {
-            "active": (0, 255, 100),
-            "idle": (100, 100, 100),
-            "busy": (255, 165, 0),
-            "error": (255, 0, 0)
-        }
-        
-        base_r, base_g, base_b = status_colors.get(self.status, (100, 100, 100))
-        
-        # Apply pulse effect
-        r = int(base_r * (0.5 + 0.5 * pulse))
-        g = int(base_g * (0.5 + 0.5 * pulse))
-        b = int(base_b * (0.5 + 0.5 * pulse))
-        
-        color_code = f"\033[38;2;{r};{g};{b}m"
-        
-        status_icon = {
-            "active": "●",
-            "idle": "○",
-            "busy": "◐",
-            "error": "✗"
-        }.get(self.status, "○")
-        
-        return f"{color_code}{status_icon} Worker-{self.worker_id} ({self.status})\033[0m"
+    def render(self, now: Optional[float] = None) -> str:
+        if now is None:
+            now = time.monotonic()
+        # 2 second cycle, quantized to PULSE_STEPS table entries
+        step = int(now * PULSE_STEPS / 2) & (PULSE_STEPS - 1)
+        return self._pulse[step] + self._label
 
 class WorkerStatusDisplay:
     def __init__(self):
@@ -203,14 +269,17 @@ class WorkerStatusDisplay:
         with self._lock:
             self.workers.pop(worker_id, None)
     
-    def render_all(self) -> str:
+    def render_all(self, now: Optional[float] = None) -> str:
         with self._lock:
             if not self.workers:
                 return ""
             
+            # One clock read per frame, shared by every indicator
+            if now is None:
+                now = time.monotonic()
             lines = ["Workers:"]
             for worker in self.workers.values():
-                lines.append(f"  {worker.render()}")
+                lines.append(f"  {worker.render(now)}")
             
             return "\n".join(lines)
 
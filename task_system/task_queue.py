@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from .task_repository import TaskRepository, Task
 from .task_claimer import TaskClaimer
 from .task_filter import TaskFilter
@@ -47,6 +47,10 @@ class TaskQueue:
         return self._claimer.complete_task(task_id, claimer_id)
     
     # Query operations
+    def get_all_tasks(self) -> Tuple[Task, ...]:
+        """Get a snapshot of every task."""
+        return self._filter.get_all_tasks()
+    
     def get_tasks_by_status(self, status: str) -> List[Task]:
         """Get tasks by status."""
         return self._filter.get_by_status(status)
@@ -71,7 +75,7 @@ class TaskQueue:
     # Convenience methods for backwards compatibility
     def size(self) -> int:
         """Get total number of tasks."""
-        return len(self._repository.get_all())
+        return self._repository.count()
     
     def is_empty(self) -> bool:
         """Check if queue is empty."""
@@ -79,6 +83,4 @@ class TaskQueue:
     
     def clear(self) -> None:
         """Clear all tasks."""
-        tasks = list(self._repository.get_all().keys())
-        for task_id in tasks:
-            self._repository.delete(task_id)
\ No newline at end of file
+        self._repository.clear()
\ No newline at end of file
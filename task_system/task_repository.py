@@ -1,7 +1,8 @@
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+import bisect
 import threading
+import time
 import uuid
-from datetime import datetime
 
 
 class Task:
@@ -12,9 +13,10 @@ class Task:
         self.priority = priority
         self.tags = tags or []
         self.status = status
-        self.created_at = datetime.utcnow()
+        # Epoch seconds (time.time()); convert with datetime.utcfromtimestamp for display
+        self.created_at = time.time()
         self.claimed_by = None
-        self.claimed_at = None
+        self.claimed_at: Optional[float] = None
 
 
 class TaskRepository:
@@ -22,15 +24,30 @@ class TaskRepository:
     
     def __init__(self):
         self._tasks: Dict[str, Task] = {}
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # Secondary indexes (dicts used as insertion-ordered sets of task IDs).
+        # Kept in sync by create/update/delete, so task fields must be changed
+        # through update() rather than assigned directly.
+        self._by_status: Dict[str, Dict[str, None]] = {}
+        self._by_claimer: Dict[str, Dict[str, None]] = {}
+        self._by_tag: Dict[str, Dict[str, None]] = {}
+        self._available: Dict[str, None] = {}
+        # Priority buckets plus their keys in sorted order, for range queries
+        self._by_priority: Dict[int, Dict[str, None]] = {}
+        self._priorities: List[int] = []
     
     def create(self, data: Dict[str, Any], priority: int = 0, 
                tags: list = None, task_id: str = None) -> str:
         """Create a new task and return its ID."""
         with self._lock:
             task_id = task_id or str(uuid.uuid4())
+            previous = self._tasks.get(task_id)
+            if previous:
+                self._unindex(previous, previous.status, previous.claimed_by,
+                              previous.tags, previous.priority)
             task = Task(task_id, data, priority, tags)
             self._tasks[task_id] = task
+            self._index(task)
             return task_id
     
     def get(self, task_id: str) -> Optional[Task]:
@@ -45,17 +62,143 @@ class TaskRepository:
             if not task:
                 return False
             
-            for key, value in updates.items():
-                if hasattr(task, key):
-                    setattr(task, key, value)
+            self._apply_updates(task, updates)
             return True
     
+    def compare_and_update(self, task_id: str, expected: Dict[str, Any], **updates) -> bool:
+        """
+        Update task fields only if every field in expected still has that value.
+        The check and the update happen in one step, so of several callers
+        racing on the same task exactly one wins.
+        """
+        with self._lock:
+            task = self._tasks.get(task_id)
+            if not task:
+                return False
+            
+            for key, value in expected.items():
+                if getattr(task, key, None) != value:
+                    return False
+            
+            self._apply_updates(task, updates)
+            return True
+    
+    def _apply_updates(self, task: Task, updates: Dict[str, Any]) -> None:
+        # Caller holds self._lock
+        old_status, old_claimer, old_tags = task.status, task.claimed_by, list(task.tags)
+        old_priority = task.priority
+        for key, value in updates.items():
+            if hasattr(task, key):
+                setattr(task, key, value)
+        self._unindex(task, old_status, old_claimer, old_tags, old_priority)
+        self._index(task)
+    
     def delete(self, task_id: str) -> bool:
         """Delete a task. Returns True if task existed and was deleted."""
         with self._lock:
-            return self._tasks.pop(task_id, None) is not None
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return False
+            self._unindex(task, task.status, task.claimed_by, task.tags, task.priority)
+            return True
+    
+    def clear(self) -> None:
+        """Delete all tasks and reset every index in one step."""
+        with self._lock:
+            self._tasks.clear()
+            self._by_status.clear()
+            self._by_claimer.clear()
+            self._by_tag.clear()
+            self._available.clear()
+            self._by_priority.clear()
+            self._priorities.clear()
     
     def get_all(self) -> Dict[str, Task]:
-        """Get all tasks (used by other components)."""
+        """Get a copy of the ID-to-task mapping. Readers that only iterate should use iter_tasks()."""
+        with self._lock:
+            return self._tasks.copy()
+    
+    def iter_tasks(self) -> Tuple[Task, ...]:
+        """Get a read-only snapshot of all tasks without copying the ID mapping."""
         with self._lock:
-            return self._tasks.copy()
\ No newline at end of file
+            return tuple(self._tasks.values())
+    
+    def count(self) -> int:
+        """Get the number of stored tasks."""
+        with self._lock:
+            return len(self._tasks)
+    
+    def get_by_status(self, status: str) -> List[Task]:
+        """Get tasks with the given status via the status index."""
+        with self._lock:
+            return [self._tasks[i] for i in self._by_status.get(status, ())]
+    
+    def get_by_claimer(self, claimer_id: str) -> List[Task]:
+        """Get tasks claimed by the given claimer via the claimer index."""
+        with self._lock:
+            return [self._tasks[i] for i in self._by_claimer.get(claimer_id, ())]
+    
+    def get_available(self) -> List[Task]:
+        """Get pending, unclaimed tasks via the availability index."""
+        with self._lock:
+            return [self._tasks[i] for i in self._available]
+    
+    def get_by_tags(self, tags: List[str], match_all: bool = False) -> List[Task]:
+        """Get tasks matching any (or all) of the given tags via the tag index."""
+        with self._lock:
+            if not tags:
+                # Vacuous match: every task has all of no tags, none has any
+                return list(self._tasks.values()) if match_all else []
+            buckets = [self._by_tag.get(tag, {}) for tag in tags]
+            if match_all:
+                smallest = min(buckets, key=len)
+                ids = [i for i in smallest if all(i in b for b in buckets)]
+            else:
+                ids = dict.fromkeys(i for b in buckets for i in b)
+            return [self._tasks[i] for i in ids]
+    
+    def get_by_priority(self, min_priority: Optional[int] = None,
+                        max_priority: Optional[int] = None) -> List[Task]:
+        """Get tasks within a priority range, lowest priority first."""
+        with self._lock:
+            lo = 0 if min_priority is None else bisect.bisect_left(self._priorities, min_priority)
+            hi = (len(self._priorities) if max_priority is None
+                  else bisect.bisect_right(self._priorities, max_priority))
+            return [self._tasks[i]
+                    for priority in self._priorities[lo:hi]
+                    for i in self._by_priority[priority]]
+    
+    def _index(self, task: Task) -> None:
+        self._by_status.setdefault(task.status, {})[task.id] = None
+        if task.claimed_by is not None:
+            self._by_claimer.setdefault(task.claimed_by, {})[task.id] = None
+        for tag in task.tags:
+            self._by_tag.setdefault(tag, {})[task.id] = None
+        if task.status == "pending" and task.claimed_by is None:
+            self._available[task.id] = None
+        if task.priority not in self._by_priority:
+            bisect.insort(self._priorities, task.priority)
+        self._by_priority.setdefault(task.priority, {})[task.id] = None
+    
+    def _unindex(self, task: Task, status: str, claimed_by: Optional[str], tags: list,
+                 priority: int) -> None:
+        _discard(self._by_status, status, task.id)
+        if claimed_by is not None:
+            _discard(self._by_claimer, claimed_by, task.id)
+        for tag in tags:
+            _discard(self._by_tag, tag, task.id)
+        self._available.pop(task.id, None)
+        _discard(self._by_priority, priority, task.id)
+        if priority not in self._by_priority:
+            index = bisect.bisect_left(self._priorities, priority)
+            if index < len(self._priorities) and self._priorities[index] == priority:
+                del self._priorities[index]
+
+
+def _discard(index: Dict[str, Dict[str, None]], key: Any, task_id: str) -> None:
+    """Remove a task ID from an index bucket, dropping the bucket when empty."""
+    bucket = index.get(key)
+    if bucket is not None:
+        bucket.pop(task_id, None)
+        if not bucket:
+            del index[key]
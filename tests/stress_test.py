@@ -1,14 +1,105 @@
 """Stress test for agentcoord - simulates multiple concurrent agents."""
 
+import asyncio
+import atexit
+import functools
 import time
 import threading
 import multiprocessing
-from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
 from agentcoord import CoordinationClient, LockAcquireTimeout
 import random
+import redis
 import sys
 
 
+# Error messages kept per agent; beyond this they are only counted, which
+# keeps the result dict small when it is pickled back from a worker process
+MAX_REPORTED_ERRORS = 10
+
+# Per-op pacing for workloads whose sleeps only spread load (seconds between ops)
+PACE_INTERVALS = {'decisions': 0.125, 'mixed': 0.1}
+
+
+class _Pacer:
+    """Paces ops at a fixed rate against a monotonic deadline."""
+
+    def __init__(self, interval: float, phase: float = 0.0):
+        self.interval = interval
+        # A per-agent phase keeps agents from firing in lockstep
+        self.deadline = time.monotonic() + phase * interval
+
+    def delay(self) -> float:
+        """Seconds to wait before the next op."""
+        self.deadline += self.interval
+        now = time.monotonic()
+        if self.deadline < now:
+            # Fell behind; resume from now rather than bursting to catch up
+            self.deadline = now
+        return self.deadline - now
+
+
+# One client per worker process (set by the pool initializer) or per thread,
+# so agents reuse a connection instead of opening one per session.
+# Thread clients draw from one shared connection pool.
+_CLIENT = None
+_thread_state = threading.local()
+_thread_clients = []
+_thread_pool = None
+_thread_clients_lock = threading.Lock()
+
+
+def _init_worker(redis_url: str):
+    """ProcessPoolExecutor initializer: connect once for the process's lifetime."""
+    global _CLIENT
+    _CLIENT = CoordinationClient(redis_url=redis_url)
+    atexit.register(_CLIENT.shutdown)
+
+
+def _worker_client(redis_url: str) -> CoordinationClient:
+    if _CLIENT is not None:
+        return _CLIENT
+    client = getattr(_thread_state, 'client', None)
+    if client is None:
+        global _thread_pool
+        with _thread_clients_lock:
+            if _thread_pool is None:
+                _thread_pool = redis.BlockingConnectionPool.from_url(
+                    redis_url, max_connections=64, decode_responses=True
+                )
+            pool = _thread_pool
+        client = _thread_state.client = CoordinationClient(
+            redis_url=redis_url, connection_pool=pool
+        )
+        with _thread_clients_lock:
+            _thread_clients.append(client)
+    return client
+
+
+def _close_thread_clients():
+    global _thread_pool
+    with _thread_clients_lock:
+        clients = list(_thread_clients)
+        _thread_clients.clear()
+        pool, _thread_pool = _thread_pool, None
+    for client in clients:
+        client.shutdown()
+    if pool is not None:
+        pool.disconnect()
+
+
+def _record_error(results: dict, message: str):
+    results['error_count'] += 1
+    if len(results['errors']) < MAX_REPORTED_ERRORS:
+        results['errors'].append(message)
+
+
+def _format_results(results: dict) -> str:
+    return (f"{results['locks_acquired']} locks ({results['locks_failed']} failed), "
+            f"{results['tasks_claimed']} tasks, {results['decisions_logged']} decisions, "
+            f"{results['error_count']} errors")
+
+
 def agent_worker(agent_id: int, redis_url: str, test_type: str, duration: int = 10):
     """Simulate an agent performing various operations."""
     results = {
@@ -17,30 +108,33 @@ def agent_worker(agent_id: int, redis_url: str, test_type: str, duration: int =
         'locks_failed': 0,
         'tasks_claimed': 0,
         'decisions_logged': 0,
+        'error_count': 0,
         'errors': []
     }
 
     try:
-        with CoordinationClient.session(
-            redis_url=redis_url,
-            role=f"Worker-{agent_id}",
-            name=f"Agent-{agent_id}",
-            working_on=f"Stress test: {test_type}"
-        ) as coord:
+        coord = _worker_client(redis_url)
+        # Pipeline decision writes when that is all the agent does
+        coord.decision_batch_size = 16 if test_type == 'decisions' else 1
+        coord.register_agent(role=f"Worker-{agent_id}", name=f"Agent-{agent_id}",
+                             working_on=f"Stress test: {test_type}")
+        try:
             print(f"[Agent {agent_id}] Started in {coord.mode} mode")
 
-            start_time = time.time()
+            rng = random.Random(agent_id)
+            pacer = _Pacer(PACE_INTERVALS.get(test_type, 0.1), rng.random())
+            start_time = time.monotonic()
 
-            while time.time() - start_time < duration:
+            while time.monotonic() - start_time < duration:
                 try:
                     if test_type == 'locks':
                         # Test file locking
-                        file_path = f"test_file_{random.randint(1, 5)}.py"
+                        file_path = f"test_file_{rng.randint(1, 5)}.py"
                         try:
                             with coord.lock_file(file_path, intent=f"Agent {agent_id} testing"):
                                 results['locks_acquired'] += 1
                                 # Simulate work
-                                time.sleep(random.uniform(0.1, 0.5))
+                                time.sleep(rng.uniform(0.1, 0.5))
                         except LockAcquireTimeout:
                             results['locks_failed'] += 1
 
@@ -49,7 +143,7 @@ def agent_worker(agent_id: int, redis_url: str, test_type: str, duration: int =
                         task = coord.claim_task(tags=['stress-test'])
                         if task:
                             results['tasks_claimed'] += 1
-                            time.sleep(random.uniform(0.1, 0.3))
+                            time.sleep(rng.uniform(0.1, 0.3))
 
                     elif test_type == 'decisions':
                         # Test decision logging
@@ -59,11 +153,11 @@ def agent_worker(agent_id: int, redis_url: str, test_type: str, duration: int =
                             reason="Testing concurrent logging"
                         )
                         results['decisions_logged'] += 1
-                        time.sleep(random.uniform(0.05, 0.2))
+                        time.sleep(pacer.delay())
 
                     elif test_type == 'mixed':
                         # Mixed operations
-                        op = random.choice(['lock', 'task', 'decision'])
+                        op = rng.choice(['lock', 'task', 'decision'])
                         if op == 'lock':
                             try:
                                 with coord.lock_file("shared_resource.py", intent="Mixed test"):
@@ -79,60 +173,195 @@ def agent_worker(agent_id: int, redis_url: str, test_type: str, duration: int =
                             coord.log_decision("test", "mixed", "stress testing")
                             results['decisions_logged'] += 1
 
-                        time.sleep(random.uniform(0.05, 0.15))
+                        time.sleep(pacer.delay())
 
                 except Exception as e:
-                    results['errors'].append(str(e))
+                    _record_error(results, str(e))
 
-            print(f"[Agent {agent_id}] Completed: {results}")
+            print(f"[Agent {agent_id}] Completed: {_format_results(results)}")
+        finally:
+            # End this agent's registration but keep the connection for the next one
+            coord.flush_decisions()
+            coord.agent_registry.unregister(coord.agent_id)
+            coord.agent_id = None
 
     except Exception as e:
-        results['errors'].append(f"Fatal: {str(e)}")
+        _record_error(results, f"Fatal: {str(e)}")
         print(f"[Agent {agent_id}] Failed: {e}")
 
     return results
 
 
+async def agent_worker_async(agent_id: int, coord: CoordinationClient, executor,
+                             test_type: str, duration: int = 10):
+    """Coroutine version of agent_worker, driving the same CoordinationClient calls.
+
+    The client API is blocking, so each call runs on the shared executor while
+    the simulated work and pacing sleeps yield to the other agents.
+    """
+    results = {
+        'agent_id': agent_id,
+        'locks_acquired': 0,
+        'locks_failed': 0,
+        'tasks_claimed': 0,
+        'decisions_logged': 0,
+        'error_count': 0,
+        'errors': []
+    }
+    loop = asyncio.get_running_loop()
+
+    def call(func, *args, **kwargs):
+        return loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+
+    async def locked_work(file_path: str, intent: str, work_time: float):
+        lock = coord.lock_file(file_path, intent=intent)
+        try:
+            await call(lock.__enter__)
+        except LockAcquireTimeout:
+            results['locks_failed'] += 1
+            return
+        try:
+            results['locks_acquired'] += 1
+            await asyncio.sleep(work_time)
+        finally:
+            await call(lock.__exit__, None, None, None)
+
+    try:
+        coord.decision_batch_size = 16 if test_type == 'decisions' else 1
+        await call(coord.register_agent, role=f"Worker-{agent_id}", name=f"Agent-{agent_id}",
+                   working_on=f"Stress test: {test_type}")
+        try:
+            print(f"[Agent {agent_id}] Started in {coord.mode} mode (async)")
+
+            rng = random.Random(agent_id)
+            pacer = _Pacer(PACE_INTERVALS.get(test_type, 0.1), rng.random())
+            start_time = time.monotonic()
+            while time.monotonic() - start_time < duration:
+                try:
+                    if test_type == 'locks':
+                        await locked_work(f"test_file_{rng.randint(1, 5)}.py",
+                                          f"Agent {agent_id} testing", rng.uniform(0.1, 0.5))
+
+                    elif test_type == 'tasks':
+                        if await call(coord.claim_task, tags=['stress-test']):
+                            results['tasks_claimed'] += 1
+                            await asyncio.sleep(rng.uniform(0.1, 0.3))
+
+                    elif test_type == 'decisions':
+                        await call(coord.log_decision, decision_type="stress_test",
+                                   context=f"Agent {agent_id} iteration",
+                                   reason="Testing concurrent logging")
+                        results['decisions_logged'] += 1
+                        await asyncio.sleep(pacer.delay())
+
+                    elif test_type == 'mixed':
+                        op = rng.choice(['lock', 'task', 'decision'])
+                        if op == 'lock':
+                            await locked_work("shared_resource.py", "Mixed test", 0.1)
+                        elif op == 'task':
+                            if await call(coord.claim_task):
+                                results['tasks_claimed'] += 1
+                        else:
+                            await call(coord.log_decision, "test", "mixed", "stress testing")
+                            results['decisions_logged'] += 1
+
+                        await asyncio.sleep(pacer.delay())
+
+                except Exception as e:
+                    _record_error(results, str(e))
+
+            print(f"[Agent {agent_id}] Completed: {_format_results(results)}")
+        finally:
+            await call(coord.flush_decisions)
+
+    except Exception as e:
+        _record_error(results, f"Fatal: {str(e)}")
+        print(f"[Agent {agent_id}] Failed: {e}")
+
+    return results
+
+
+async def _run_agents_async(num_agents: int, redis_url: str, test_type: str, duration: int):
+    """Drive every simulated agent from one event loop over a shared connection pool."""
+    pool = redis.BlockingConnectionPool.from_url(
+        redis_url, max_connections=num_agents, decode_responses=True
+    )
+    clients = [CoordinationClient(redis_url=redis_url, connection_pool=pool)
+               for _ in range(num_agents)]
+    executor = ThreadPoolExecutor(max_workers=num_agents)
+    try:
+        return await asyncio.gather(*(
+            agent_worker_async(i, coord, executor, test_type, duration)
+            for i, coord in enumerate(clients)
+        ))
+    finally:
+        executor.shutdown()
+        for coord in clients:
+            coord.shutdown()
+        pool.disconnect()
+
+
+def _aggregate(results):
+    """Fold agent results into totals one at a time as they arrive."""
+    totals = dict.fromkeys(
+        ('locks_acquired', 'locks_failed', 'tasks_claimed', 'decisions_logged', 'error_count'), 0
+    )
+    errors_by_agent = {}
+    for r in results:
+        for key in totals:
+            totals[key] += r[key]
+        if r['errors']:
+            errors_by_agent[r['agent_id']] = r['errors']
+    return totals, errors_by_agent
+
+
 def run_stress_test(
     test_name: str,
     test_type: str,
     num_agents: int,
     duration: int,
     redis_url: str,
-    use_processes: bool = False
+    use_processes: bool = False,
+    use_async: bool = False
 ):
     """Run a stress test scenario."""
+    execution = 'Async' if use_async else 'Processes' if use_processes else 'Threads'
     print(f"\n{'='*80}")
     print(f"STRESS TEST: {test_name}")
     print(f"Agents: {num_agents} | Duration: {duration}s | Type: {test_type}")
-    print(f"Execution: {'Processes' if use_processes else 'Threads'}")
+    print(f"Execution: {execution}")
     print(f"{'='*80}\n")
 
     start_time = time.time()
 
-    if use_processes:
-        with ProcessPoolExecutor(max_workers=num_agents) as executor:
+    if use_async:
+        results = asyncio.run(_run_agents_async(num_agents, redis_url, test_type, duration))
+        totals, errors_by_agent = _aggregate(results)
+    elif use_processes:
+        with ProcessPoolExecutor(max_workers=num_agents, initializer=_init_worker,
+                                 initargs=(redis_url,)) as executor:
             futures = [
                 executor.submit(agent_worker, i, redis_url, test_type, duration)
                 for i in range(num_agents)
             ]
-            results = [f.result() for f in futures]
+            # Fold in each agent as it finishes rather than holding every result
+            totals, errors_by_agent = _aggregate(f.result() for f in as_completed(futures))
     else:
         with ThreadPoolExecutor(max_workers=num_agents) as executor:
             futures = [
                 executor.submit(agent_worker, i, redis_url, test_type, duration)
                 for i in range(num_agents)
             ]
-            results = [f.result() for f in futures]
+            totals, errors_by_agent = _aggregate(f.result() for f in as_completed(futures))
+        _close_thread_clients()
 
     elapsed = time.time() - start_time
 
-    # Aggregate results
-    total_locks_acquired = sum(r['locks_acquired'] for r in results)
-    total_locks_failed = sum(r['locks_failed'] for r in results)
-    total_tasks = sum(r['tasks_claimed'] for r in results)
-    total_decisions = sum(r['decisions_logged'] for r in results)
-    total_errors = sum(len(r['errors']) for r in results)
+    total_locks_acquired = totals['locks_acquired']
+    total_locks_failed = totals['locks_failed']
+    total_tasks = totals['tasks_claimed']
+    total_decisions = totals['decisions_logged']
+    total_errors = totals['error_count']
 
     print(f"\n{'='*80}")
     print(f"RESULTS: {test_name}")
@@ -149,9 +378,8 @@ def run_stress_test(
 
     if total_errors > 0:
         print(f"\n⚠️  ERRORS DETECTED:")
-        for r in results:
-            if r['errors']:
-                print(f"  Agent {r['agent_id']}: {r['errors'][:3]}")  # Show first 3 errors
+        for agent_id in sorted(errors_by_agent):
+            print(f"  Agent {agent_id}: {errors_by_agent[agent_id][:3]}")  # Show first 3 errors
 
     # Performance metrics
     if test_type == 'locks':
@@ -215,6 +443,17 @@ def main():
         use_processes=False
     ))
 
+    # Test 2b (opt-in with --async): the same load, all agents on one event loop
+    if "--async" in sys.argv[1:] and mode == "Redis":
+        all_results.append(run_stress_test(
+            test_name="Medium Load - File Locking (async)",
+            test_type="locks",
+            num_agents=10,
+            duration=10,
+            redis_url=redis_url,
+            use_async=True
+        ))
+
     # Test 3: Heavy load - File locking
     if mode == "Redis":
         all_results.append(run_stress_test(
@@ -254,8 +493,9 @@ def main():
     total_errors = sum(r['errors'] for r in all_results)
 
     for r in all_results:
-        status = "✓ PASS" if r['errors'] == 0 else "✗ FAIL"
-        print(f"{status} | {r['test_name']:<40} | {r['elapsed']:.1f}s | {r['errors']} errors")
+        errors = r['errors']
+        status = "✓ PASS" if errors == 0 else "✗ FAIL"
+        print(f"{status} | {r['test_name']:<40} | {r['elapsed']:.1f}s | {errors} errors")
 
     print(f"{'='*80}")
 
@@ -1,10 +1,13 @@
 """Tests for communication channel system."""
 
+import gc
 import json
-import uuid
+import re
+import time
+import weakref
+from collections import namedtuple
 from datetime import datetime
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
 
 import pytest
 
@@ -21,6 +24,46 @@ from agentcoord.channels import (
 )
 
 
+@pytest.fixture
+def log_file(tmp_path):
+    """Per-test path for a FileChannel's JSONL log."""
+    return tmp_path / "messages.jsonl"
+
+
+@pytest.fixture
+def file_channel(log_file):
+    """FileChannel writing to log_file."""
+    return FileChannel(name="file", log_path=log_file)
+
+
+# Canonical str(uuid.uuid4()) form: lowercase hex, hyphenated
+_UUID_RE = re.compile(r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$")
+
+
+def _entries(log_file):
+    """Parse every JSONL entry in a FileChannel log."""
+    return [json.loads(line) for line in log_file.read_text().splitlines()]
+
+
+# Built once at import; DashboardChannel.post only stores them, never modifies them
+_NUMBERED_MESSAGES = tuple(
+    Message(content=f"Message {i}", from_agent="agent-1") for i in range(10)
+)
+
+PopulatedManager = namedtuple("PopulatedManager", "manager terminal file dashboard")
+
+
+@pytest.fixture
+def populated_manager(file_channel):
+    """ChannelManager with terminal, file and dashboard channels added."""
+    manager = ChannelManager()
+    terminal = TerminalChannel(name="terminal")
+    dashboard = DashboardChannel(name="dashboard")
+    for channel in (terminal, file_channel, dashboard):
+        manager.add_channel(channel)
+    return PopulatedManager(manager, terminal, file_channel, dashboard)
+
+
 class TestMessage:
     """Test Message dataclass."""
 
@@ -56,7 +99,7 @@ class TestMessage:
 
         assert msg.metadata is not None
         assert isinstance(msg.metadata, dict)
-        assert len(msg.metadata) == 0
+        assert not msg.metadata
 
     def test_message_custom_metadata(self):
         """Message can have custom metadata."""
@@ -104,37 +147,21 @@ class TestMessage:
         assert msg.message_type.value == "success"
 
 
-class TestMessagePriority:
-    """Test MessagePriority enum."""
-
-    def test_priority_levels_defined(self):
-        """All priority levels are defined."""
-        assert MessagePriority.LOW.value == "low"
-        assert MessagePriority.NORMAL.value == "normal"
-        assert MessagePriority.HIGH.value == "high"
-        assert MessagePriority.URGENT.value == "urgent"
+class TestMessageEnums:
+    """Test MessagePriority and MessageType enums."""
 
-    def test_priority_is_string_enum(self):
-        """MessagePriority inherits from str."""
-        assert isinstance(MessagePriority.NORMAL, str)
-        assert MessagePriority.HIGH == "high"
-
-
-class TestMessageType:
-    """Test MessageType enum."""
-
-    def test_message_types_defined(self):
-        """All message types are defined."""
-        assert MessageType.STATUS.value == "status"
-        assert MessageType.ERROR.value == "error"
-        assert MessageType.SUCCESS.value == "success"
-        assert MessageType.QUESTION.value == "question"
-        assert MessageType.ANNOUNCEMENT.value == "announcement"
-
-    def test_message_type_is_string_enum(self):
-        """MessageType inherits from str."""
-        assert isinstance(MessageType.STATUS, str)
-        assert MessageType.ERROR == "error"
+    @pytest.mark.parametrize("enum_cls, expected", [
+        (MessagePriority, {"LOW": "low", "NORMAL": "normal", "HIGH": "high", "URGENT": "urgent"}),
+        (MessageType, {"STATUS": "status", "ERROR": "error", "SUCCESS": "success",
+                       "QUESTION": "question", "ANNOUNCEMENT": "announcement"}),
+    ])
+    def test_members_are_string_values(self, enum_cls, expected):
+        """All members are defined and compare equal to their string values."""
+        for name, value in expected.items():
+            member = enum_cls[name]
+            assert member.value == value
+            assert isinstance(member, str)
+            assert member == value
 
 
 class TestTerminalChannel:
@@ -221,15 +248,16 @@ class TestTerminalChannel:
         output = captured.out
         assert "Thread reply" in output
 
-    def test_terminal_supports_formatting_only(self):
+    @pytest.mark.parametrize("feature, expected", [
+        ("formatting", True),
+        ("threads", False),
+        ("dms", False),
+        ("reactions", False),
+        ("persistence", False),
+    ])
+    def test_terminal_supports_formatting_only(self, feature, expected):
         """TerminalChannel only supports formatting feature."""
-        channel = TerminalChannel()
-
-        assert channel.supports_feature("formatting") is True
-        assert channel.supports_feature("threads") is False
-        assert channel.supports_feature("dms") is False
-        assert channel.supports_feature("reactions") is False
-        assert channel.supports_feature("persistence") is False
+        assert TerminalChannel().supports_feature(feature) is expected
 
     def test_terminal_enable_disable(self):
         """TerminalChannel can be enabled/disabled."""
@@ -245,14 +273,11 @@ class TestTerminalChannel:
 class TestFileChannel:
     """Test FileChannel (JSONL file writing)."""
 
-    def test_file_channel_creation(self, tmp_path):
+    def test_file_channel_creation(self, file_channel, log_file):
         """FileChannel can be created."""
-        log_file = tmp_path / "test.jsonl"
-        channel = FileChannel(name="file", log_path=log_file)
-
-        assert channel.name == "file"
-        assert channel.log_path == log_file
-        assert channel.enabled is True
+        assert file_channel.name == "file"
+        assert file_channel.log_path == log_file
+        assert file_channel.enabled is True
 
     def test_file_channel_default_path(self):
         """FileChannel uses default path if not specified."""
@@ -260,11 +285,8 @@ class TestFileChannel:
 
         assert channel.log_path == Path("agentcoord_messages.jsonl")
 
-    def test_file_channel_post_writes_jsonl(self, tmp_path):
+    def test_file_channel_post_writes_jsonl(self, file_channel, log_file):
         """FileChannel.post writes valid JSONL to file."""
-        log_file = tmp_path / "messages.jsonl"
-        channel = FileChannel(log_path=log_file)
-
         msg = Message(
             content="Test message",
             from_agent="agent-1",
@@ -273,15 +295,12 @@ class TestFileChannel:
             message_type=MessageType.STATUS,
         )
 
-        result = channel.post(msg)
+        result = file_channel.post(msg)
 
         assert result is True
-        assert log_file.exists()
 
         # Verify JSONL format
-        with open(log_file) as f:
-            line = f.readline()
-            entry = json.loads(line)
+        entry = _entries(log_file)[0]
 
         assert entry["event_type"] == "post"
         assert entry["from_agent"] == "agent-1"
@@ -291,110 +310,96 @@ class TestFileChannel:
         assert entry["content"] == "Test message"
         assert "timestamp" in entry
 
-    def test_file_channel_dm_writes_jsonl(self, tmp_path):
+    def test_file_channel_dm_writes_jsonl(self, file_channel, log_file):
         """FileChannel.dm writes DM to JSONL."""
-        log_file = tmp_path / "messages.jsonl"
-        channel = FileChannel(log_path=log_file)
-
         msg = Message(content="Direct message", from_agent="agent-1", to_agent="agent-2")
 
-        result = channel.dm(msg)
+        result = file_channel.dm(msg)
 
         assert result is True
 
-        with open(log_file) as f:
-            line = f.readline()
-            entry = json.loads(line)
+        entry = _entries(log_file)[0]
 
         assert entry["event_type"] == "dm"
         assert entry["to_agent"] == "agent-2"
 
-    def test_file_channel_create_thread(self, tmp_path):
+    def test_file_channel_create_thread(self, file_channel, log_file):
         """FileChannel.create_thread generates thread_id and writes to file."""
-        log_file = tmp_path / "messages.jsonl"
-        channel = FileChannel(log_path=log_file)
-
         msg = Message(content="Thread start", from_agent="agent-1")
 
-        thread_id = channel.create_thread(msg)
+        thread_id = file_channel.create_thread(msg)
 
         assert thread_id is not None
         assert isinstance(thread_id, str)
-        # Verify it's a valid UUID
-        uuid.UUID(thread_id)
+        assert _UUID_RE.match(thread_id)
 
-        with open(log_file) as f:
-            line = f.readline()
-            entry = json.loads(line)
+        entry = _entries(log_file)[0]
 
         assert entry["event_type"] == "thread_create"
         assert entry["thread_id"] == thread_id
         assert entry["metadata"]["thread_start"] is True
 
-    def test_file_channel_reply_to_thread(self, tmp_path):
+    def test_file_channel_reply_to_thread(self, file_channel, log_file):
         """FileChannel.reply_to_thread writes thread reply."""
-        log_file = tmp_path / "messages.jsonl"
-        channel = FileChannel(log_path=log_file)
-
         msg = Message(
             content="Thread reply", from_agent="agent-1", thread_id="thread-123"
         )
 
-        result = channel.reply_to_thread(msg)
+        result = file_channel.reply_to_thread(msg)
 
         assert result is True
 
-        with open(log_file) as f:
-            line = f.readline()
-            entry = json.loads(line)
+        entry = _entries(log_file)[0]
 
         assert entry["event_type"] == "thread_reply"
         assert entry["thread_id"] == "thread-123"
 
-    def test_file_channel_multiple_messages(self, tmp_path):
+    def test_file_channel_multiple_messages(self, file_channel, log_file):
         """FileChannel appends multiple messages to JSONL."""
-        log_file = tmp_path / "messages.jsonl"
-        channel = FileChannel(log_path=log_file)
+        sent = [("First", "agent-1"), ("Second", "agent-2"), ("Third", "agent-3")]
+        msgs = tuple(Message(content=c, from_agent=a) for c, a in sent)
+
+        for msg in msgs:
+            file_channel.post(msg)
+
+        entries = _entries(log_file)
 
-        msg1 = Message(content="First", from_agent="agent-1")
-        msg2 = Message(content="Second", from_agent="agent-2")
-        msg3 = Message(content="Third", from_agent="agent-3")
+        assert [(e["content"], e["from_agent"]) for e in entries] == sent
 
-        channel.post(msg1)
-        channel.post(msg2)
-        channel.post(msg3)
+    def test_file_channel_iter_entries(self, log_file):
+        """FileChannel.iter_entries streams logged entries, including buffered ones."""
+        channel = FileChannel(log_path=log_file, max_buffered=10, flush_interval=60)
+        assert list(channel.iter_entries()) == []
 
-        with open(log_file) as f:
-            lines = f.readlines()
+        channel.post(_NUMBERED_MESSAGES[0])
+        channel.dm(_NUMBERED_MESSAGES[1])
 
-        assert len(lines) == 3
-        entries = [json.loads(line) for line in lines]
-        assert entries[0]["content"] == "First"
-        assert entries[1]["content"] == "Second"
-        assert entries[2]["content"] == "Third"
+        entries = list(channel.iter_entries())
 
-    def test_file_channel_disabled(self, tmp_path):
+        assert entries == _entries(log_file)
+        assert [e["event_type"] for e in entries] == ["post", "dm"]
+
+    def test_file_channel_disabled(self, file_channel, log_file):
         """FileChannel.post returns False when disabled."""
-        log_file = tmp_path / "messages.jsonl"
-        channel = FileChannel(log_path=log_file)
-        channel.disable()
+        file_channel.disable()
 
         msg = Message(content="Should not write", from_agent="agent-1")
 
-        result = channel.post(msg)
+        result = file_channel.post(msg)
 
         assert result is False
         assert not log_file.exists()
 
-    def test_file_channel_supports_features(self):
+    @pytest.mark.parametrize("feature, expected", [
+        ("threads", True),
+        ("persistence", True),
+        ("formatting", False),
+        ("dms", False),
+        ("reactions", False),
+    ])
+    def test_file_channel_supports_features(self, feature, expected):
         """FileChannel supports threads and persistence."""
-        channel = FileChannel()
-
-        assert channel.supports_feature("threads") is True
-        assert channel.supports_feature("persistence") is True
-        assert channel.supports_feature("formatting") is False
-        assert channel.supports_feature("dms") is False
-        assert channel.supports_feature("reactions") is False
+        assert FileChannel().supports_feature(feature) is expected
 
     def test_file_channel_creates_parent_directory(self, tmp_path):
         """FileChannel creates parent directories if they don't exist."""
@@ -404,8 +409,76 @@ class TestFileChannel:
         msg = Message(content="Test", from_agent="agent-1")
         channel.post(msg)
 
-        assert nested_path.exists()
-        assert nested_path.parent.exists()
+        assert nested_path.stat().st_size > 0
+
+    def test_file_channel_buffered_writes_full_batch(self, log_file):
+        """Buffered FileChannel writes once max_buffered entries are queued."""
+        channel = FileChannel(log_path=log_file, max_buffered=3, flush_interval=60)
+
+        channel.post(_NUMBERED_MESSAGES[0])
+        channel.post(_NUMBERED_MESSAGES[1])
+        assert not log_file.exists()
+
+        channel.post(_NUMBERED_MESSAGES[2])
+        assert [e["content"] for e in _entries(log_file)] == [
+            "Message 0", "Message 1", "Message 2"
+        ]
+
+    def test_file_channel_flush_writes_partial_batch(self, log_file):
+        """FileChannel.flush writes entries still waiting in the buffer."""
+        channel = FileChannel(log_path=log_file, max_buffered=10, flush_interval=60)
+        manager = ChannelManager()
+        manager.add_channel(channel)
+
+        channel.post(_NUMBERED_MESSAGES[0])
+        manager.flush()
+
+        assert [e["content"] for e in _entries(log_file)] == ["Message 0"]
+
+    def test_file_channel_close_writes_buffer_and_reopens(self, log_file):
+        """FileChannel.close writes pending entries; later posts reopen the log."""
+        channel = FileChannel(log_path=log_file, max_buffered=10, flush_interval=60)
+        manager = ChannelManager()
+        manager.add_channel(channel)
+
+        channel.post(_NUMBERED_MESSAGES[0])
+        manager.close()
+        assert len(_entries(log_file)) == 1
+
+        channel.max_buffered = 1
+        channel.post(_NUMBERED_MESSAGES[1])
+        channel.close()
+
+        assert [e["content"] for e in _entries(log_file)] == ["Message 0", "Message 1"]
+
+    def test_file_channel_flush_interval_writes_without_more_posts(self, log_file):
+        """A partial batch is written once flush_interval passes, even if posting stops."""
+        channel = FileChannel(log_path=log_file, max_buffered=10, flush_interval=0.05)
+
+        channel.post(_NUMBERED_MESSAGES[0])
+        assert not log_file.exists()
+
+        deadline = time.monotonic() + 5
+        while not log_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert [e["content"] for e in _entries(log_file)] == ["Message 0"]
+        channel.close()
+
+    def test_file_channel_dropped_channel_is_collected(self, log_file):
+        """An unreferenced buffered FileChannel is collected and writes its batch."""
+        channel = FileChannel(log_path=log_file, max_buffered=10, flush_interval=60)
+        channel.post(_NUMBERED_MESSAGES[0])
+        channel.flush()
+        channel.post(_NUMBERED_MESSAGES[1])
+        channel._flush_timer.cancel()
+        channel._flush_timer = None
+        ref = weakref.ref(channel)
+
+        del channel
+        gc.collect()
+
+        assert ref() is None
+        assert [e["content"] for e in _entries(log_file)] == ["Message 0", "Message 1"]
 
 
 class TestDashboardChannel:
@@ -417,16 +490,15 @@ class TestDashboardChannel:
 
         assert channel.name == "dashboard"
         assert channel.enabled is True
-        assert len(channel.messages) == 0
-        assert len(channel.threads) == 0
+        assert not channel.messages
+        assert not channel.threads
 
     def test_dashboard_custom_max_messages(self):
         """DashboardChannel respects max_messages limit."""
         channel = DashboardChannel(max_messages=5)
 
         # Add more messages than max
-        for i in range(10):
-            msg = Message(content=f"Message {i}", from_agent="agent-1")
+        for msg in _NUMBERED_MESSAGES:
             channel.post(msg)
 
         # Only last 5 should be kept
@@ -506,17 +578,18 @@ class TestDashboardChannel:
         result = channel.post(msg)
 
         assert result is False
-        assert len(channel.messages) == 0
-
-    def test_dashboard_supports_features(self):
+        assert not channel.messages
+
+    @pytest.mark.parametrize("feature, expected", [
+        ("threads", True),
+        ("formatting", True),
+        ("realtime", True),
+        ("dms", False),
+        ("persistence", False),
+    ])
+    def test_dashboard_supports_features(self, feature, expected):
         """DashboardChannel supports threads, formatting, and realtime."""
-        channel = DashboardChannel()
-
-        assert channel.supports_feature("threads") is True
-        assert channel.supports_feature("formatting") is True
-        assert channel.supports_feature("realtime") is True
-        assert channel.supports_feature("dms") is False
-        assert channel.supports_feature("persistence") is False
+        assert DashboardChannel().supports_feature(feature) is expected
 
     @pytest.mark.skipif(not RICH_AVAILABLE, reason="Rich not available")
     def test_dashboard_render_creates_table(self):
@@ -531,12 +604,12 @@ class TestDashboardChannel:
         from rich.table import Table
         assert isinstance(table, Table)
 
-    def test_dashboard_render_without_rich(self):
+    def test_dashboard_render_without_rich(self, monkeypatch):
         """DashboardChannel._render returns None if Rich unavailable."""
-        with patch("agentcoord.channels.RICH_AVAILABLE", False):
-            channel = DashboardChannel()
-            result = channel._render()
-            assert result is None
+        monkeypatch.setattr("agentcoord.channels.RICH_AVAILABLE", False)
+        channel = DashboardChannel()
+        result = channel._render()
+        assert result is None
 
 
 class TestChannelManager:
@@ -546,7 +619,7 @@ class TestChannelManager:
         """ChannelManager can be created."""
         manager = ChannelManager()
 
-        assert len(manager.channels) == 0
+        assert not manager.channels
 
     def test_add_channel(self):
         """ChannelManager.add_channel adds channel."""
@@ -593,7 +666,7 @@ class TestChannelManager:
 
         manager.remove_channel("terminal")
 
-        assert len(manager.channels) == 0
+        assert not manager.channels
         assert manager.get_channel("terminal") is None
 
     def test_get_channel_nonexistent(self):
@@ -604,56 +677,40 @@ class TestChannelManager:
 
         assert result is None
 
-    def test_post_broadcasts_to_all_channels(self, tmp_path):
+    def test_post_broadcasts_to_all_channels(self, populated_manager, log_file):
         """ChannelManager.post broadcasts to all enabled channels."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-        dashboard = DashboardChannel(name="dashboard")
-
-        manager.add_channel(file_ch)
-        manager.add_channel(dashboard)
+        pm = populated_manager
 
-        results = manager.post(
+        results = pm.manager.post(
             channel="engineering",
             content="Broadcast message",
             from_agent="agent-1",
         )
 
+        assert results["terminal"] is True
         assert results["file"] is True
         assert results["dashboard"] is True
-        assert log_file.exists()
-        assert len(dashboard.messages) == 1
+        assert log_file.stat().st_size > 0
+        assert len(pm.dashboard.messages) == 1
 
-    def test_post_skips_disabled_channels(self, tmp_path):
+    def test_post_skips_disabled_channels(self, populated_manager, log_file):
         """ChannelManager.post skips disabled channels."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-        file_ch.disable()
-
-        manager.add_channel(file_ch)
+        pm = populated_manager
+        pm.file.disable()
 
-        results = manager.post(
+        results = pm.manager.post(
             channel="engineering",
             content="Should not write",
             from_agent="agent-1",
         )
 
         assert "file" not in results
+        assert results["dashboard"] is True
         assert not log_file.exists()
 
-    def test_dm_broadcasts_to_all_channels(self, tmp_path):
+    def test_dm_broadcasts_to_all_channels(self, populated_manager):
         """ChannelManager.dm sends DM to all enabled channels."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-        dashboard = DashboardChannel(name="dashboard")
-
-        manager.add_channel(file_ch)
-        manager.add_channel(dashboard)
-
-        results = manager.dm(
+        results = populated_manager.manager.dm(
             from_agent="agent-1",
             to_agent="agent-2",
             content="Direct message",
@@ -662,17 +719,9 @@ class TestChannelManager:
         assert results["file"] is True
         assert results["dashboard"] is True
 
-    def test_create_thread_broadcasts(self, tmp_path):
+    def test_create_thread_broadcasts(self, populated_manager):
         """ChannelManager.create_thread creates threads on all channels."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-        dashboard = DashboardChannel(name="dashboard")
-
-        manager.add_channel(file_ch)
-        manager.add_channel(dashboard)
-
-        results = manager.create_thread(
+        results = populated_manager.manager.create_thread(
             channel="engineering",
             title="Thread Title",
             content="Thread content",
@@ -686,15 +735,9 @@ class TestChannelManager:
         # Dashboard returns thread_id
         assert results["dashboard"] is not None
 
-    def test_reply_to_thread_broadcasts(self, tmp_path):
+    def test_reply_to_thread_broadcasts(self, populated_manager):
         """ChannelManager.reply_to_thread sends replies to all channels."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-        dashboard = DashboardChannel(name="dashboard")
-
-        manager.add_channel(file_ch)
-        manager.add_channel(dashboard)
+        manager = populated_manager.manager
 
         # Create thread first
         thread_ids = manager.create_thread(
@@ -715,17 +758,9 @@ class TestChannelManager:
         assert results["file"] is True
         assert results["dashboard"] is True
 
-    def test_broadcast(self, tmp_path):
+    def test_broadcast(self, populated_manager):
         """ChannelManager.broadcast sends to all channels."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-        dashboard = DashboardChannel(name="dashboard")
-
-        manager.add_channel(file_ch)
-        manager.add_channel(dashboard)
-
-        results = manager.broadcast(
+        results = populated_manager.manager.broadcast(
             content="System announcement",
             from_agent="system",
             priority=MessagePriority.URGENT,
@@ -735,49 +770,32 @@ class TestChannelManager:
         assert results["file"] is True
         assert results["dashboard"] is True
 
-    def test_enable_channels(self):
+    def test_enable_channels(self, populated_manager):
         """ChannelManager.enable_channels enables specific channels."""
-        manager = ChannelManager()
-        terminal = TerminalChannel(name="terminal")
-        file_ch = FileChannel(name="file")
+        pm = populated_manager
+        pm.terminal.disable()
+        pm.file.disable()
 
-        terminal.disable()
-        file_ch.disable()
+        pm.manager.enable_channels(["terminal"])
 
-        manager.add_channel(terminal)
-        manager.add_channel(file_ch)
-
-        manager.enable_channels(["terminal"])
-
-        assert terminal.enabled is True
-        assert file_ch.enabled is False
+        assert pm.terminal.enabled is True
+        assert pm.file.enabled is False
 
-    def test_disable_channels(self):
+    def test_disable_channels(self, populated_manager):
         """ChannelManager.disable_channels disables specific channels."""
-        manager = ChannelManager()
-        terminal = TerminalChannel(name="terminal")
-        file_ch = FileChannel(name="file")
+        pm = populated_manager
 
-        manager.add_channel(terminal)
-        manager.add_channel(file_ch)
+        pm.manager.disable_channels(["file"])
 
-        manager.disable_channels(["file"])
+        assert pm.terminal.enabled is True
+        assert pm.file.enabled is False
+        assert pm.dashboard.enabled is True
 
-        assert terminal.enabled is True
-        assert file_ch.enabled is False
-
-    def test_list_channels(self):
+    def test_list_channels(self, populated_manager):
         """ChannelManager.list_channels returns channel info."""
-        manager = ChannelManager()
-        terminal = TerminalChannel(name="terminal")
-        file_ch = FileChannel(name="file")
-
-        manager.add_channel(terminal)
-        manager.add_channel(file_ch)
+        channels = populated_manager.manager.list_channels()
 
-        channels = manager.list_channels()
-
-        assert len(channels) == 2
+        assert len(channels) == 3
 
         terminal_info = next(ch for ch in channels if ch["name"] == "terminal")
         assert terminal_info["enabled"] is True
@@ -789,82 +807,145 @@ class TestChannelManager:
         assert file_info["features"]["threads"] is True
         assert file_info["features"]["persistence"] is True
 
-
-class TestChannelIntegration:
-    """Integration tests for channel system."""
-
-    def test_full_workflow(self, tmp_path):
-        """Test complete workflow: post, dm, thread create, reply."""
-        manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
+    def test_async_mode_delivers_in_order(self, file_channel, log_file):
+        """Async ChannelManager queues posts and delivers them in order."""
+        manager = ChannelManager(async_mode=True)
         dashboard = DashboardChannel(name="dashboard")
-
-        manager.add_channel(file_ch)
+        manager.add_channel(file_channel)
         manager.add_channel(dashboard)
 
-        # Post to channel
-        manager.post(
-            channel="engineering",
-            content="Feature completed",
-            from_agent="agent-1",
-            message_type=MessageType.SUCCESS,
-        )
-
-        # Send DM
-        manager.dm(
-            from_agent="agent-1",
-            to_agent="agent-2",
-            content="Can you review?",
-        )
-
-        # Create thread
+        assert manager.post(channel="eng", content="First", from_agent="agent-1") == {}
+        manager.dm(from_agent="agent-1", to_agent="agent-2", content="Second")
+        # create_thread runs inline, after the queued messages
         thread_ids = manager.create_thread(
-            channel="code-review",
-            title="PR #123",
-            content="Please review changes",
-            from_agent="agent-1",
+            channel="eng", title="Third", content="", from_agent="agent-1"
         )
-
-        # Reply to thread (each channel has its own thread_id)
-        # Reply to file channel's thread
         manager.reply_to_thread(
-            thread_id=thread_ids["file"],
-            channel="code-review",
-            content="Looks good from file!",
-            from_agent="agent-2",
+            thread_id=thread_ids["file"], channel="eng", content="Fourth", from_agent="agent-2"
         )
+        manager.flush()
+
+        assert [e["event_type"] for e in _entries(log_file)] == [
+            "post", "dm", "thread_create", "thread_reply"
+        ]
+        assert [m.content for m in dashboard.messages] == ["First", "Second"]
+        manager.close()
+
+    def test_async_mode_close_stops_worker(self, file_channel, log_file):
+        """ChannelManager.close delivers queued messages and stops the worker."""
+        manager = ChannelManager(async_mode=True)
+        manager.add_channel(file_channel)
+
+        manager.broadcast(content="Shutting down", from_agent="system")
+        worker = manager._worker
+        manager.close()
+
+        assert not worker.is_alive()
+        assert _entries(log_file)[0]["content"] == "Shutting down"
+
+    def test_async_mode_dropped_manager_stops_worker(self, file_channel, log_file):
+        """An unreferenced async ChannelManager is collected and its worker delivers and exits."""
+        manager = ChannelManager(async_mode=True)
+        manager.add_channel(file_channel)
+        manager.post(channel="eng", content="Queued", from_agent="agent-1")
+        worker = manager._worker
+        ref = weakref.ref(manager)
+
+        del manager
+        gc.collect()
+
+        assert ref() is None
+        assert not worker.is_alive()
+        assert _entries(log_file)[0]["content"] == "Queued"
+
+    def test_async_mode_delivers_inline_after_close(self, file_channel, log_file):
+        """Posts after ChannelManager.close are delivered inline, not dropped."""
+        manager = ChannelManager(async_mode=True)
+        manager.add_channel(file_channel)
+        manager.post(channel="eng", content="Before", from_agent="agent-1")
+        manager.close()
+
+        assert manager.post(channel="eng", content="After", from_agent="agent-1") == {"file": True}
+        assert manager._worker is None
+        assert [e["content"] for e in _entries(log_file)] == ["Before", "After"]
+
+
+# (event_type, field, value) for each line test_full_workflow writes to the file log
+_EXPECTED_WORKFLOW = (
+    ("post", "content", "Feature completed"),
+    ("dm", "to_agent", "agent-2"),
+    ("thread_create", "content", "**PR #123**\n\nPlease review changes"),
+    ("thread_reply", "content", "Looks good from file!"),
+    ("thread_reply", "content", "Looks good from dashboard!"),
+)
 
-        # Reply to dashboard's thread
-        manager.reply_to_thread(
-            thread_id=thread_ids["dashboard"],
-            channel="code-review",
-            content="Looks good from dashboard!",
-            from_agent="agent-3",
-        )
 
-        # Verify file output
-        with open(log_file) as f:
-            lines = f.readlines()
+def _run_workflow(manager):
+    """Post, DM, start a thread and reply to it through manager; return the thread IDs."""
+    # Post to channel
+    manager.post(
+        channel="engineering",
+        content="Feature completed",
+        from_agent="agent-1",
+        message_type=MessageType.SUCCESS,
+    )
+
+    # Send DM
+    manager.dm(
+        from_agent="agent-1",
+        to_agent="agent-2",
+        content="Can you review?",
+    )
+
+    # Create thread
+    thread_ids = manager.create_thread(
+        channel="code-review",
+        title="PR #123",
+        content="Please review changes",
+        from_agent="agent-1",
+    )
+
+    # Reply to thread (each channel has its own thread_id)
+    # Reply to file channel's thread
+    manager.reply_to_thread(
+        thread_id=thread_ids["file"],
+        channel="code-review",
+        content="Looks good from file!",
+        from_agent="agent-2",
+    )
+
+    # Reply to dashboard's thread
+    manager.reply_to_thread(
+        thread_id=thread_ids["dashboard"],
+        channel="code-review",
+        content="Looks good from dashboard!",
+        from_agent="agent-3",
+    )
+
+    return thread_ids
 
-        # File channel should have: post, dm, thread_create, 2 thread_replies
-        assert len(lines) == 5
-        entries = [json.loads(line) for line in lines]
 
-        assert entries[0]["event_type"] == "post"
-        assert entries[0]["content"] == "Feature completed"
+class TestChannelIntegration:
+    """Integration tests for channel system."""
+
+    def test_full_workflow(self, file_channel, log_file):
+        """Test complete workflow: post, dm, thread create, reply."""
+        manager = ChannelManager()
+        dashboard = DashboardChannel(name="dashboard")
 
-        assert entries[1]["event_type"] == "dm"
-        assert entries[1]["to_agent"] == "agent-2"
+        manager.add_channel(file_channel)
+        manager.add_channel(dashboard)
 
-        assert entries[2]["event_type"] == "thread_create"
-        assert "PR #123" in entries[2]["content"]
+        thread_ids = _run_workflow(manager)
 
-        assert entries[3]["event_type"] == "thread_reply"
-        assert "Looks good from file!" in entries[3]["content"]
+        # Verify file output
+        entries = _entries(log_file)
 
-        assert entries[4]["event_type"] == "thread_reply"
-        assert "Looks good from dashboard!" in entries[4]["content"]
+        # File channel should have: post, dm, thread_create, 2 thread_replies
+        assert len(entries) == len(_EXPECTED_WORKFLOW)
+        for entry, (event_type, field, value) in zip(entries, _EXPECTED_WORKFLOW):
+            assert entry["event_type"] == event_type
+            assert entry[field] == value
 
         # Verify dashboard state
         # DashboardChannel adds to messages for: post, dm, and thread replies (not thread creation)
@@ -873,13 +954,25 @@ class TestChannelIntegration:
         assert len(dashboard.threads) == 1
         assert len(dashboard.threads[thread_ids["dashboard"]]) == 2  # Initial + 1 reply
 
-    def test_priority_and_type_handling(self, tmp_path):
+    def test_full_workflow_benchmark(self, request, log_file):
+        """Time the full workflow; skipped unless pytest-benchmark is installed."""
+        pytest.importorskip("pytest_benchmark")
+        benchmark = request.getfixturevalue("benchmark")
+
+        def fresh_manager():
+            manager = ChannelManager()
+            manager.add_channel(FileChannel(name="file", log_path=log_file))
+            manager.add_channel(DashboardChannel(name="dashboard"))
+            return (manager,), {}
+
+        thread_ids = benchmark.pedantic(_run_workflow, setup=fresh_manager, rounds=100)
+
+        assert set(thread_ids) == {"file", "dashboard"}
+
+    def test_priority_and_type_handling(self, file_channel, log_file):
         """Test message priority and type are preserved."""
         manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-
-        manager.add_channel(file_ch)
+        manager.add_channel(file_channel)
 
         manager.post(
             channel="alerts",
@@ -889,19 +982,15 @@ class TestChannelIntegration:
             message_type=MessageType.ERROR,
         )
 
-        with open(log_file) as f:
-            entry = json.loads(f.readline())
+        entry = _entries(log_file)[0]
 
         assert entry["priority"] == "urgent"
         assert entry["message_type"] == "error"
 
-    def test_metadata_preservation(self, tmp_path):
+    def test_metadata_preservation(self, file_channel, log_file):
         """Test metadata is preserved through channel."""
         manager = ChannelManager()
-        log_file = tmp_path / "messages.jsonl"
-        file_ch = FileChannel(name="file", log_path=log_file)
-
-        manager.add_channel(file_ch)
+        manager.add_channel(file_channel)
 
         manager.post(
             channel="metrics",
@@ -910,8 +999,7 @@ class TestChannelIntegration:
             metadata={"cpu": 75, "memory": 82, "disk": 45},
         )
 
-        with open(log_file) as f:
-            entry = json.loads(f.readline())
+        entry = _entries(log_file)[0]
 
         assert entry["metadata"]["cpu"] == 75
         assert entry["metadata"]["memory"] == 82
@@ -1,7 +1,8 @@
 """Tests for CoordinationClient initialization and basic functionality."""
 
 import pytest
-from agentcoord.client import CoordinationClient
+from agentcoord import CoordinationClient
+from agentcoord.coordination_client import InMemoryTransport
 
 
 def test_client_initializes_with_redis_url():
@@ -14,13 +15,15 @@ def test_client_initializes_with_redis_url():
 
 def test_client_falls_back_to_file_mode_when_redis_unavailable():
     """CoordinationClient should fall back to file mode when Redis is unreachable."""
-    # Use invalid Redis URL to force fallback
+    # An unreachable in-memory transport forces fallback without opening a socket
     client = CoordinationClient(
-        redis_url="redis://localhost:9999",  # Non-existent Redis
-        fallback_dir="/tmp/agentcoord_test"
+        redis_url="redis://localhost:9999",
+        fallback_dir="/tmp/agentcoord_test",
+        transport=InMemoryTransport(reachable=False)
     )
 
-    assert client.mode == "file"
+    assert client.mode == "fallback"
+    assert client.redis_client is None
     assert client.fallback_dir == "/tmp/agentcoord_test"
 
 
@@ -0,0 +1,116 @@
+"""Tests for CoordinationClient's Redis reachability probe."""
+
+import socket
+
+import pytest
+
+from agentcoord import coordination_client
+from agentcoord.coordination_client import CoordinationClient, InMemoryTransport
+
+
+@pytest.fixture
+def connect_calls(monkeypatch):
+    """Record probe connects and refuse every one of them."""
+    calls = []
+
+    def refuse(address, timeout=None):
+        calls.append(address)
+        raise ConnectionRefusedError(address)
+
+    CoordinationClient.clear_probe_cache()
+    monkeypatch.setattr(socket, "create_connection", refuse)
+    yield calls
+    CoordinationClient.clear_probe_cache()
+
+
+def test_unreachable_redis_falls_back_without_ping(connect_calls):
+    """An unreachable address falls back to fallback mode after one probe."""
+    client = CoordinationClient(redis_url="redis://localhost:9999")
+
+    assert client.mode == "fallback"
+    assert client.redis_client is None
+    assert connect_calls == [("localhost", 9999)]
+
+
+def test_unreachable_probe_result_is_cached(connect_calls):
+    """Clients for a recently unreachable address skip the probe."""
+    for _ in range(3):
+        assert CoordinationClient(redis_url="redis://localhost:9999").mode == "fallback"
+
+    assert len(connect_calls) == 1
+
+
+def test_probe_cache_expires_and_can_be_cleared(connect_calls, monkeypatch):
+    """Unreachable addresses are probed again after the TTL or a cache clear."""
+    CoordinationClient(redis_url="redis://localhost:9999")
+
+    CoordinationClient.clear_probe_cache()
+    CoordinationClient(redis_url="redis://localhost:9999")
+    assert len(connect_calls) == 2
+
+    monkeypatch.setattr(coordination_client, "PROBE_CACHE_TTL", 0.0)
+    CoordinationClient.clear_probe_cache()
+    CoordinationClient(redis_url="redis://localhost:9999")
+    CoordinationClient(redis_url="redis://localhost:9999")
+    assert len(connect_calls) == 4
+
+
+def test_unix_socket_url_probes_socket_path(tmp_path):
+    """unix:// URLs are probed at their socket path instead of localhost:6379."""
+    socket_path = str(tmp_path / "redis.sock")
+    CoordinationClient.clear_probe_cache()
+
+    client = CoordinationClient(redis_url=f"unix://{socket_path}")
+
+    assert client.mode == "fallback"
+    assert coordination_client._probe_results[socket_path][0] is False
+    CoordinationClient.clear_probe_cache()
+
+
+def test_reachable_probe_result_is_cached(monkeypatch):
+    """Clients for a recently reachable address skip the probe connect."""
+    calls = []
+
+    class _Sock:
+        def close(self):
+            pass
+
+    def accept(address, timeout=None):
+        calls.append(address)
+        return _Sock()
+
+    CoordinationClient.clear_probe_cache()
+    monkeypatch.setattr(socket, "create_connection", accept)
+
+    assert coordination_client._redis_reachable(("localhost", 6379)) is True
+    assert coordination_client._redis_reachable(("localhost", 6379)) is True
+    assert calls == [("localhost", 6379)]
+    CoordinationClient.clear_probe_cache()
+
+
+@pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="unix sockets not supported")
+def test_reachable_unix_socket(tmp_path):
+    """The probe connects to a listening unix socket."""
+    socket_path = str(tmp_path / "redis.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(socket_path)
+        server.listen(1)
+
+        assert coordination_client._redis_reachable(socket_path) is True
+
+
+def test_transport_for_url():
+    """URLs map to TCP or unix socket transports."""
+    tcp = coordination_client.transport_for_url("redis://example:6380")
+    unix = coordination_client.transport_for_url("unix:///tmp/redis.sock")
+
+    assert (tcp.host, tcp.port) == ("example", 6380)
+    assert unix.path == "/tmp/redis.sock"
+
+
+def test_in_memory_transport_skips_sockets(connect_calls):
+    """An injected transport decides reachability without any socket probe."""
+    client = CoordinationClient(transport=InMemoryTransport(reachable=False))
+
+    assert client.mode == "fallback"
+    assert connect_calls == []
@@ -3,7 +3,7 @@
 import time
 from agentcoord import CoordinationClient
 from agentcoord.spawner import WorkerSpawner, SpawnMode
-from agentcoord.tasks import TaskQueue
+from agentcoord.tasks import TASK_STATUS_CHANNEL
 
 print("\n" + "="*70)
 print(" FULL ORCHESTRATION DEMO: Coordinator + Workers + Tasks")
@@ -21,7 +21,8 @@ print("\n📝 STEP 2: Create Task Queue")
 print("-" * 70)
 
 if coord.mode == "redis" and coord.redis_client:
-    task_queue = TaskQueue(coord.redis_client)
+    # The coordinator's queue publishes status changes for the monitor below
+    task_queue = coord.task_queue
 
     tasks_to_create = [
         {"title": "Process user data", "priority": 5, "tags": ["backend"]},
@@ -32,12 +33,10 @@ if coord.mode == "redis" and coord.redis_client:
     ]
 
     for task_def in tasks_to_create:
-        task = task_queue.create_task(
-            title=task_def["title"],
-            description=f"Demo task: {task_def['title']}",
-            priority=task_def["priority"],
-            tags=task_def["tags"]
-        )
+        task_def["description"] = f"Demo task: {task_def['title']}"
+
+    # One batched write instead of a round-trip per task
+    for task in task_queue.create_tasks_bulk(tasks_to_create):
         print(f"  📌 Created: {task.title} (priority: {task.priority}, tags: {task.tags})")
 
     print(f"\n✅ Created {len(tasks_to_create)} tasks")
@@ -81,37 +80,62 @@ print("-" * 70)
 print("Workers are now claiming and executing tasks...")
 print("(Workers will run for ~10-15 seconds)\n")
 
-for i in range(3):
-    time.sleep(3)
-    stats = spawner.get_worker_stats()
-    alive = stats['alive']
-    print(f"  [{i*3:2d}s] Workers alive: {alive}/{stats['total_spawned']}")
+is_redis = coord.mode == "redis" and coord.redis_client is not None
+
+if is_redis:
+    # Wake on status-change events and read the queue's server-side counters,
+    # instead of re-reading every task on a timer
+    pubsub = coord.redis_client.pubsub(ignore_subscribe_messages=True)
+    pubsub.subscribe(TASK_STATUS_CHANNEL)
+    counts = task_queue.get_status_counts()
+
+    start = time.monotonic()
+    deadline = start + 15
+    while (counts.get("pending", 0) + counts.get("claimed", 0) > 0
+           and time.monotonic() < deadline):
+        message = pubsub.get_message(timeout=max(0.0, deadline - time.monotonic()))
+        if message is None:
+            continue
+
+        counts = task_queue.get_status_counts()
 
-    if coord.mode == "redis" and coord.redis_client:
-        all_tasks = task_queue.list_tasks()
-        completed = sum(1 for t in all_tasks if t.status.value == "completed")
-        in_progress = sum(1 for t in all_tasks if t.status.value == "in_progress")
-        pending = sum(1 for t in all_tasks if t.status.value == "pending")
-        print(f"       Tasks: {completed} completed, {in_progress} in progress, {pending} pending")
+        stats = spawner.get_worker_stats()
+        print(f"  [{time.monotonic() - start:4.1f}s] Workers alive: {stats['alive']}/{stats['total_spawned']}")
+        print(f"       Tasks: {counts.get('completed', 0)} completed, {counts.get('claimed', 0)} in progress, "
+              f"{counts.get('pending', 0)} pending")
+
+    pubsub.close()
+else:
+    time.sleep(9)
+    stats = spawner.get_worker_stats()
+    print(f"  Workers alive: {stats['alive']}/{stats['total_spawned']}")
 
 # Step 5: View results
 print("\n📊 STEP 5: Final Results")
 print("-" * 70)
 
-if coord.mode == "redis" and coord.redis_client:
-    all_tasks = task_queue.list_tasks()
-    completed_tasks = [t for t in all_tasks if t.status.value == "completed"]
+if is_redis:
+    all_tasks = task_queue.get_all_tasks()
+
+    # Partition in one pass, reading each task's status once
+    completed_tasks = []
+    incomplete = []
+    for task in all_tasks:
+        status = task.status.value
+        if status == "completed":
+            completed_tasks.append(task)
+        else:
+            incomplete.append((task, status))
 
     print(f"\nCompleted tasks: {len(completed_tasks)}/{len(all_tasks)}")
     for task in completed_tasks:
         print(f"  ✅ {task.title}")
 
     # Show incomplete
-    incomplete = [t for t in all_tasks if t.status.value != "completed"]
     if incomplete:
         print(f"\nIncomplete tasks: {len(incomplete)}")
-        for task in incomplete:
-            print(f"  ⏳ {task.title} ({task.status.value})")
+        for task, status in incomplete:
+            print(f"  ⏳ {task.title} ({status})")
 
 # Step 6: Cleanup
 print("\n🧹 STEP 6: Cleanup")
@@ -178,6 +178,35 @@ def test_parallelization_planning():
     assert 'task-4' in later_waves
 
 
+def test_prepared_plan_reuse(sample_tasks):
+    """Test that one prepared plan serves every optimization mode."""
+    planner = TaskPlanner()
+
+    prepared = planner.prepare(sample_tasks)
+    assert prepared.levels == [[0], [1, 2]]
+
+    for mode in OptimizationMode:
+        from_prepared = planner.create_execution_plan(tasks=prepared, optimization_mode=mode)
+        from_tasks = planner.create_execution_plan(tasks=sample_tasks, optimization_mode=mode)
+        assert from_prepared.to_dict() == from_tasks.to_dict()
+
+    # Mode adjustments must not modify the shared baseline analysis
+    assert prepared.complexities == TaskPlanner().prepare(sample_tasks).complexities
+
+
+def test_prepare_reuses_unchanged_tasks(sample_tasks):
+    """Test that re-preparing the same task contents skips the analysis."""
+    planner = TaskPlanner()
+
+    prepared = planner.prepare(sample_tasks)
+    assert planner.prepare([dict(task) for task in sample_tasks]) is prepared
+
+    sample_tasks[2]['depends_on'] = []
+    changed = planner.prepare(sample_tasks)
+    assert changed is not prepared
+    assert changed.levels == [[0, 2], [1]]
+
+
 def test_model_distribution(sample_tasks):
     """Test model distribution tracking."""
     planner = TaskPlanner()
@@ -0,0 +1,168 @@
+"""Tests for progress aggregation, coalesced flushes and report scheduling."""
+
+import asyncio
+
+import pytest
+
+from src.progress import aggregator as aggregator_module
+from src.progress.aggregator import ProgressAggregator, VECTORIZE_THRESHOLD
+from src.progress.models import NodeType, ProgressReport, Status
+from src.progress.reporter import ProgressReporter
+
+
+def _report(node_id, progress, status=Status.RUNNING, throughput=None):
+    return ProgressReport(
+        node_id=node_id,
+        node_type=NodeType.WORKER,
+        status=status,
+        progress_percentage=progress,
+        throughput=throughput
+    )
+
+
+async def _hierarchy(children, parent="parent", weights=None):
+    agg = ProgressAggregator()
+    for i, child_id in enumerate(children):
+        weight = weights[i] if weights else 1.0
+        await agg.register_node(child_id, parent_id=parent, weight=weight)
+    return agg
+
+
+def test_concurrent_updates_share_one_aggregation(monkeypatch):
+    """Reports arriving in the same loop pass propagate through one recomputation."""
+    async def scenario():
+        agg = await _hierarchy(["a", "b", "c"])
+        calls = []
+        original = agg._aggregate_progress
+
+        def counting(node_id):
+            calls.append(node_id)
+            return original(node_id)
+
+        monkeypatch.setattr(agg, "_aggregate_progress", counting)
+        results = await asyncio.gather(
+            agg.update_progress(_report("a", 30.0)),
+            agg.update_progress(_report("b", 60.0)),
+            agg.update_progress(_report("c", 90.0)),
+        )
+        return calls, results
+
+    calls, results = asyncio.run(scenario())
+
+    assert calls == ["parent"]
+    assert all(result is results[0] for result in results)
+    assert results[0].total_progress == pytest.approx(60.0)
+    assert results[0].child_count == 3
+
+
+def test_nested_updates_recompute_children_before_parents():
+    """A coalesced flush updates intermediate nodes before the root reads them."""
+    async def scenario():
+        agg = ProgressAggregator()
+        await agg.register_node("mid", parent_id="root")
+        await agg.register_node("w1", parent_id="mid")
+        await agg.register_node("w2", parent_id="mid")
+        await asyncio.gather(
+            agg.update_progress(_report("w1", 100.0, Status.COMPLETED)),
+            agg.update_progress(_report("w2", 50.0)),
+        )
+        return agg._latest
+
+    latest = asyncio.run(scenario())
+
+    assert latest["mid"].weighted_progress == pytest.approx(75.0)
+    assert latest["root"].weighted_progress == pytest.approx(75.0)
+
+
+def test_version_bumps_only_when_output_changes():
+    """Aggregated versions increase monotonically and only on changed output."""
+    async def scenario():
+        agg = await _hierarchy(["a", "b"])
+        versions = []
+        for progress in (10.0, 10.0, 20.0, 20.0, 40.0):
+            result = await agg.update_progress(_report("a", progress))
+            versions.append(result.version)
+        return versions
+
+    versions = asyncio.run(scenario())
+
+    assert versions == [1, 1, 2, 2, 3]
+
+
+@pytest.mark.skipif(not aggregator_module.NUMPY_AVAILABLE, reason="numpy not installed")
+@pytest.mark.parametrize("width", [VECTORIZE_THRESHOLD - 1, VECTORIZE_THRESHOLD, VECTORIZE_THRESHOLD + 1])
+def test_vectorized_matches_pure_python(width):
+    """NumPy child arrays give the same result as the plain loop around the threshold."""
+    async def scenario():
+        children = [f"w{i}" for i in range(width)]
+        weights = [1.0 + (i % 3) for i in range(width)]
+        agg = await _hierarchy(children, weights=weights)
+        for i, child_id in enumerate(children):
+            if i % 7 == 0:
+                continue  # never reported
+            if i % 5 == 0:
+                report = _report(child_id, 5.0, Status.BLOCKED)
+            elif i % 11 == 0:
+                report = _report(child_id, 2.0, throughput=0.01)
+            elif i % 4 == 0:
+                report = _report(child_id, 100.0, Status.COMPLETED)
+            else:
+                report = _report(child_id, float(i * 3 % 100))
+            await agg.update_progress(report)
+        return agg
+
+    agg = asyncio.run(scenario())
+
+    plain = agg._aggregate_children("parent")
+    vectorized = agg._aggregate_children_vectorized("parent")
+    assert vectorized[0] == pytest.approx(plain[0])
+    assert vectorized[1] == pytest.approx(plain[1])
+    assert vectorized[2:] == plain[2:]
+    assert plain[4]  # the data includes bottlenecks to compare
+
+
+class _RecordingAggregator:
+    def __init__(self):
+        self.reports = []
+
+    async def update_progress(self, report):
+        self.reports.append(report)
+
+
+def test_reporter_coalesces_updates_between_sends():
+    """Rapid progress updates on an active reporter collapse into few sends."""
+    async def scenario():
+        sink = _RecordingAggregator()
+        reporter = ProgressReporter("w1", NodeType.WORKER, sink, report_interval=0.2)
+        reporter.current_status = Status.RUNNING
+        await reporter.start_reporting()
+        await asyncio.sleep(0.05)  # first scheduler pass sends the initial state
+        for step in range(1, 21):
+            await reporter.update_progress(step * 5.0)
+        await asyncio.sleep(0.3)
+        await reporter.stop_reporting()
+        return sink.reports
+
+    reports = asyncio.run(scenario())
+
+    # The initial send, then one more for all twenty updates
+    assert 2 <= len(reports) <= 3
+    assert reports[-1].progress_percentage == 100.0
+
+
+def test_reporter_sends_status_changes_immediately():
+    """Status transitions bypass the scheduler and are sent at once."""
+    async def scenario():
+        sink = _RecordingAggregator()
+        reporter = ProgressReporter("w1", NodeType.WORKER, sink, report_interval=60.0)
+        await reporter.start_reporting()
+        await asyncio.sleep(0.05)
+        sent_before = len(sink.reports)
+        await reporter.mark_completed()
+        return sent_before, sink.reports
+
+    sent_before, reports = asyncio.run(scenario())
+
+    assert sent_before == 1
+    assert len(reports) == 2
+    assert reports[-1].status == Status.COMPLETED
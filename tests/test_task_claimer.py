@@ -1,3 +1,4 @@
+import threading
 import unittest
 from task_system.task_repository import TaskRepository
 from task_system.task_claimer import TaskClaimer
@@ -39,6 +40,23 @@ class TestTaskClaimer(unittest.TestCase):
         task = self.repo.get(task_id)
         self.assertEqual(task.status, "completed")
 
+    
+    def test_concurrent_claims_have_one_winner(self):
+        task_id = self.repo.create({"action": "test"})
+        results = []
+        
+        def claim(worker):
+            results.append(self.claimer.claim_task(task_id, worker))
+        
+        threads = [threading.Thread(target=claim, args=(f"worker-{i}",)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(results.count(True), 1)
+        self.assertEqual(self.repo.get(task_id).status, "claimed")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -1,6 +1,7 @@
 import unittest
 from task_system.task_repository import TaskRepository
 from task_system.task_filter import TaskFilter
+from task_system.task_claimer import TaskClaimer
 
 
 class TestTaskFilter(unittest.TestCase):
@@ -29,4 +30,44 @@ class TestTaskFilter(unittest.TestCase):
         urgent_tasks = self.filter.get_by_tags(["urgent"])
         self.assertEqual(len(urgent_tasks), 2)
         
-        # Match all
\ No newline at end of file
+        # Match all
+        api_urgent = self.filter.get_by_tags(["urgent", "api"], match_all=True)
+        self.assertEqual(len(api_urgent), 1)
+        self.assertEqual(api_urgent[0].id, self.task1)
+    
+    def test_get_by_priority(self):
+        ids = [t.id for t in self.filter.get_by_priority(2, 5)]
+        self.assertEqual(ids, [self.task3, self.task2])
+        self.assertEqual(len(self.filter.get_by_priority()), 3)
+        self.assertEqual(self.filter.get_by_priority(min_priority=6), [])
+        
+        self.repo.update(self.task3, priority=0)
+        ids = [t.id for t in self.filter.get_by_priority(max_priority=1)]
+        self.assertEqual(ids, [self.task3, self.task1])
+    
+    def test_indexes_follow_claims(self):
+        claimer = TaskClaimer(self.repo)
+        claimer.claim_task(self.task1, "worker-1")
+        
+        available = self.filter.get_available_tasks()
+        self.assertEqual([t.id for t in available], [self.task3])
+        self.assertEqual([t.id for t in self.filter.get_by_claimer("worker-1")], [self.task1])
+        self.assertEqual(len(self.filter.get_by_status("claimed")), 1)
+        
+        claimer.release_task(self.task1, "worker-1")
+        self.assertEqual(len(self.filter.get_available_tasks()), 2)
+        self.assertEqual(self.filter.get_by_claimer("worker-1"), [])
+    
+    def test_indexes_follow_delete(self):
+        self.repo.delete(self.task1)
+        
+        self.assertEqual([t.id for t in self.filter.get_by_tags(["urgent"])], [self.task3])
+        self.assertEqual([t.id for t in self.filter.get_by_status("pending")], [self.task3])
+    
+    def test_get_all_tasks(self):
+        self.assertEqual([t.id for t in self.filter.get_all_tasks()],
+                         [self.task1, self.task2, self.task3])
+
+
+if __name__ == '__main__':
+    unittest.main()
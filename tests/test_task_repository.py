@@ -36,6 +36,25 @@ class TestTaskRepository(unittest.TestCase):
         
         # Delete non-existent task
         self.assertFalse(self.repo.delete("fake-id"))
+    
+    def test_iter_tasks_snapshot(self):
+        first = self.repo.create({"action": "a"})
+        snapshot = self.repo.iter_tasks()
+        self.repo.create({"action": "b"})
+        
+        # Later writes do not show up in an existing snapshot
+        self.assertEqual([task.id for task in snapshot], [first])
+        self.assertEqual(len(self.repo.iter_tasks()), 2)
+    
+    def test_clear(self):
+        self.repo.create({"action": "a"}, priority=2, tags=["urgent"])
+        self.repo.create({"action": "b"})
+        
+        self.repo.clear()
+        self.assertEqual(self.repo.count(), 0)
+        self.assertEqual(self.repo.get_available(), [])
+        self.assertEqual(self.repo.get_by_tags(["urgent"]), [])
+        self.assertEqual(self.repo.get_by_priority(), [])
 
 
 if __name__ == '__main__':